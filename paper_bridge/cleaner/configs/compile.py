@@ -0,0 +1,20 @@
+"""Precompile ``config.yaml`` into the ``config.json`` sidecar.
+
+Run at image build time (``python -m paper_bridge.cleaner.configs.compile``) so
+the Lambda cold start reads JSON instead of parsing YAML.
+"""
+
+from paper_bridge.cleaner.configs.config import CONFIG_PATH, compile_sidecar
+from paper_bridge.cleaner.src.logger import logger
+
+
+def main() -> None:
+    if not CONFIG_PATH.exists():
+        logger.info("No '%s' to compile; defaults will be used", CONFIG_PATH)
+        return
+    sidecar_path = compile_sidecar()
+    logger.info("Compiled '%s' to '%s'", CONFIG_PATH, sidecar_path)
+
+
+if __name__ == "__main__":
+    main()
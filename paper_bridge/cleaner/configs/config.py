@@ -1,47 +1,136 @@
 from pathlib import Path
 from typing import Literal
 
-import yaml
-from dotenv import load_dotenv
-from pydantic import Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from paper_bridge.cleaner.src import LocalPaths
-from paper_bridge.shared import BaseModelWithDefaults
+from paper_bridge.shared import none_to_default, yaml_loader
 
+# The parsed config is cached for the life of the container (see ``Config.load``)
+# and shared by every invocation, so it is frozen against accidental mutation.
+_FROZEN = ConfigDict(frozen=True)
+
+
+class Resources(BaseModel):
+    model_config = _FROZEN
 
-class Resources(BaseModelWithDefaults):
     project_name: str = Field(min_length=1)
     stage: Literal["dev", "prod"] = Field(default="dev")
     default_region_name: str = Field(default="us-west-2")
 
+    _none_to_default = field_validator("*", mode="before")(none_to_default)
+
+
+class Cleaner(BaseModel):
+    model_config = _FROZEN
 
-class Cleaner(BaseModelWithDefaults):
     days_back: int = Field(default=365, ge=1)
     days_range: int = Field(default=7, ge=1)
     opensearch_indexes: list[str] = Field(
         default_factory=lambda: ["chunk", "statement"]
     )
 
+    _none_to_default = field_validator("*", mode="before")(none_to_default)
+
+
+class Config(BaseModel):
+    model_config = _FROZEN
 
-class Config(BaseModelWithDefaults):
     resources: Resources = Field(
         default_factory=lambda: Resources(project_name="paper-bridge")
     )
     cleaner: Cleaner = Field(default_factory=Cleaner)
 
+    _none_to_default = field_validator("*", mode="before")(none_to_default)
+
     @classmethod
     def from_yaml(cls, file_path: str | Path) -> "Config":
+        # Imported lazily (as is python-dotenv in ``load``): the Lambda image reads
+        # the prebuilt JSON sidecar and never needs either on its cold start.
+        import yaml
+
         try:
-            with open(file_path, encoding="utf-8") as file:
-                config_data = yaml.safe_load(file) or {}
+            # One read; libyaml decodes UTF-8 bytes itself, skipping TextIOWrapper.
+            raw = Path(file_path).read_bytes()
+            config_data = yaml.load(raw, Loader=yaml_loader()) or {}
             return cls(**config_data)
         except (OSError, yaml.YAMLError) as e:
             raise ValueError(f"Failed to load config from {file_path}: {e}") from e
 
+    @classmethod
+    def from_json(cls, file_path: str | Path) -> "Config":
+        # pydantic-core parses and validates the raw bytes in one pass, without
+        # building an intermediate Python dict. Malformed JSON surfaces as a
+        # ValidationError, which is already a ValueError.
+        try:
+            raw = Path(file_path).read_bytes()
+        except OSError as e:
+            raise ValueError(f"Failed to load config from {file_path}: {e}") from e
+        return cls.model_validate_json(raw)
+
     @classmethod
     def load(cls) -> "Config":
-        load_dotenv()
-        config_path = Path(__file__).parent.parent / LocalPaths.CONFIG_FILE.value
-        if not config_path.exists():
-            return cls()
-        return cls.from_yaml(config_path)
+        """Load the config, reusing the parsed instance across warm invocations.
+
+        Prefers the JSON sidecar written at image build time (see
+        ``configs/compile.py``) while it is at least as new as config.yaml. The
+        cache is keyed on the source file and its mtime so an edited config is
+        still picked up during local development.
+        """
+        global _CONFIG_CACHE, _DOTENV_LOADED
+        if not _DOTENV_LOADED:
+            from dotenv import load_dotenv
+
+            load_dotenv()
+            _DOTENV_LOADED = True
+
+        source = _resolve_config_source()
+        if _CONFIG_CACHE is not None and _CONFIG_CACHE[0] == source:
+            return _CONFIG_CACHE[1]
+
+        if source is None:
+            config = cls()
+        elif source[0].suffix == ".json":
+            config = cls.from_json(source[0])
+        else:
+            config = cls.from_yaml(source[0])
+        _CONFIG_CACHE = (source, config)
+        return config
+
+
+CONFIG_PATH: Path = Path(__file__).parent / LocalPaths.CONFIG_FILE.value
+SIDECAR_PATH: Path = Path(__file__).parent / LocalPaths.CONFIG_SIDECAR_FILE.value
+
+# ((source file, mtime) or None when defaults were used, parsed Config) for the
+# current container.
+_CONFIG_CACHE: tuple[tuple[Path, float] | None, Config] | None = None
+_DOTENV_LOADED: bool = False
+
+
+def _mtime(path: Path) -> float | None:
+    try:
+        return path.stat().st_mtime
+    except FileNotFoundError:
+        return None
+
+
+def _resolve_config_source() -> tuple[Path, float] | None:
+    yaml_mtime = _mtime(CONFIG_PATH)
+    sidecar_mtime = _mtime(SIDECAR_PATH)
+    if sidecar_mtime is not None and (
+        yaml_mtime is None or sidecar_mtime >= yaml_mtime
+    ):
+        return SIDECAR_PATH, sidecar_mtime
+    if yaml_mtime is not None:
+        return CONFIG_PATH, yaml_mtime
+    return None
+
+
+def compile_sidecar(
+    yaml_path: Path = CONFIG_PATH, sidecar_path: Path = SIDECAR_PATH
+) -> Path:
+    """Parse ``yaml_path`` once and write it out as JSON for fast cold starts."""
+    # Validate before writing so a broken config fails the image build.
+    config = Config.from_yaml(yaml_path)
+    sidecar_path.write_text(config.model_dump_json(), encoding="utf-8")
+    return sidecar_path
@@ -1,12 +1,6 @@
-import argparse
 import sys
 from datetime import UTC, datetime, timedelta
-from pathlib import Path
-from typing import Any
-
-import boto3
-
-sys.path.append(str(Path(__file__).parent.parent.parent))
+from typing import TYPE_CHECKING, Any
 
 from paper_bridge.cleaner.configs import Config
 from paper_bridge.cleaner.src import (
@@ -14,7 +8,7 @@ from paper_bridge.cleaner.src import (
     Cleaner,
     EnvVars,
     SSMParams,
-    get_ssm_param_value,
+    get_ssm_param_values,
     is_running_in_aws,
 )
 
@@ -22,23 +16,40 @@ from paper_bridge.cleaner.src import (
 # which is ambiguous with the ``logger`` submodule depending on import order —
 # see the note in summarizer/main.py.
 from paper_bridge.cleaner.src.logger import logger
-from paper_bridge.shared import format_alarm
+from paper_bridge.shared import format_alarm, is_iso_date
+
+if TYPE_CHECKING:
+    import boto3
+
+# Parse the config during the Lambda INIT phase; ``Config.load`` caches it so
+# every invocation in this container reuses the same instance.
+Config.load()
+
+_ONE_DAY = timedelta(days=1)
 
 
 class DateFormatError(Exception):
     pass
 
 
-def setup_dependencies() -> tuple[Config, boto3.Session]:
-    config = Config.load()
-    profile_name = EnvVars.AWS_PROFILE_NAME.env_value
-    boto_session = (
-        boto3.Session(region_name=EnvVars.DEFAULT_REGION_NAME.env_value)
-        if is_running_in_aws()
-        else boto3.Session(
-            region_name=config.resources.default_region_name, profile_name=profile_name
-        )
-    )
+# boto3 is imported on first use and the session reused for the life of the
+# container, keeping both off the per-invocation (and import-time) path.
+_SESSION: "boto3.Session | None" = None
+
+
+def _get_session(region_name: str | None, profile_name: str | None) -> "boto3.Session":
+    global _SESSION
+    if _SESSION is not None:
+        return _SESSION
+
+    import boto3
+
+    if is_running_in_aws():
+        # Lambda injects the execution-role credentials as env vars. Without a
+        # profile botocore resolves them from the environment and never reads
+        # ~/.aws/config or ~/.aws/credentials.
+        region_name, profile_name = EnvVars.DEFAULT_REGION_NAME.env_value, None
+    boto_session = boto3.Session(region_name=region_name, profile_name=profile_name)
 
     try:
         sts = boto_session.client("sts")
@@ -49,6 +60,14 @@ def setup_dependencies() -> tuple[Config, boto3.Session]:
     except Exception as e:
         logger.error("Failed to get session identity: %s", e)
 
+    _SESSION = boto_session
+    return boto_session
+
+
+def setup_dependencies() -> "tuple[Config, boto3.Session]":
+    config = Config.load()
+    profile_name = None if is_running_in_aws() else EnvVars.AWS_PROFILE_NAME.env_value
+    boto_session = _get_session(config.resources.default_region_name, profile_name)
     return config, boto_session
 
 
@@ -82,11 +101,15 @@ def parse_event_params(
 
 def parse_target_date(date_str: str | None) -> datetime:
     if not date_str:
-        return datetime.now(UTC).replace(
-            hour=0, minute=0, second=0, microsecond=0
-        ) - timedelta(days=1)
+        # now(UTC) is already UTC-aware; only the time-of-day needs zeroing.
+        today = datetime.now(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
+        return today - _ONE_DAY
     try:
-        return datetime.strptime(date_str, "%Y-%m-%d").replace(tzinfo=UTC)
+        # is_iso_date pins the exact YYYY-MM-DD shape; fromisoformat (C) then
+        # rejects impossible dates.
+        if not is_iso_date(date_str):
+            raise ValueError(f"Invalid date {date_str!r}, expected YYYY-MM-DD")
+        return datetime.fromisoformat(date_str).replace(tzinfo=UTC)
     except ValueError as e:
         raise DateFormatError(
             f"Invalid date format for TARGET_DATE: '{date_str}'. Use 'YYYY-MM-DD'."
@@ -113,7 +136,7 @@ def calculate_date_range(
 
 
 def send_failure_notification(
-    session: boto3.Session, topic_arn: str, date_range: str, error: Exception
+    session: "boto3.Session", topic_arn: str, date_range: str, error: Exception
 ) -> None:
     sns = session.client("sns")
     subject, message = format_alarm(
@@ -137,12 +160,14 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
         logger.info("Calculated deletion range: '%s' to '%s'", start_date, end_date)
 
         base_path = f"/{config.resources.project_name}-{config.resources.stage}"
-        neptune_endpoint = get_ssm_param_value(
-            boto_session, f"{base_path}/{SSMParams.NEPTUNE_ENDPOINT.value}"
-        )
-        opensearch_endpoint = get_ssm_param_value(
-            boto_session, f"{base_path}/{SSMParams.OPENSEARCH_ENDPOINT.value}"
+        neptune_param = f"{base_path}/{SSMParams.NEPTUNE_ENDPOINT.value}"
+        opensearch_param = f"{base_path}/{SSMParams.OPENSEARCH_ENDPOINT.value}"
+        # One GetParameters round-trip for both endpoints (none once cached).
+        endpoints = get_ssm_param_values(
+            boto_session, [neptune_param, opensearch_param]
         )
+        neptune_endpoint = endpoints[neptune_param]
+        opensearch_endpoint = endpoints[opensearch_param]
 
         cleaner = Cleaner(
             boto_session,
@@ -188,6 +213,9 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
 
 
 if __name__ == "__main__":
+    # Local CLI only: keep argparse (and gettext/textwrap) off the Lambda import path.
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Clean old documents from Paper Bridge."
     )
@@ -1,15 +1,54 @@
-from .aws_helpers import get_ssm_param_value
-from .cleaner import Cleaner
-from .constants import NULL_STRING, EnvVars, LocalPaths, SSMParams
-from .logger import is_running_in_aws, logger
-
-__all__ = [
-    "NULL_STRING",
-    "Cleaner",
-    "EnvVars",
-    "LocalPaths",
-    "SSMParams",
-    "get_ssm_param_value",
-    "is_running_in_aws",
-    "logger",
-]
+"""Cleaner package.
+
+Public symbols are exported lazily (PEP 562) so importing a light-weight module
+(the config, constants or logger) does not eagerly pull in ``Cleaner`` and the
+Gremlin / OpenSearch clients behind it.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+# Map each public symbol to the submodule that defines it.
+_EXPORTS: dict[str, str] = {
+    # aws_helpers (imports the shared Neptune/OpenSearch clients)
+    "get_ssm_param_value": ".aws_helpers",
+    "get_ssm_param_values": ".aws_helpers",
+    # cleaner (heavy)
+    "Cleaner": ".cleaner",
+    # constants
+    "EnvVars": ".constants",
+    "LocalPaths": ".constants",
+    "NULL_STRING": ".constants",
+    "SSMParams": ".constants",
+    # NOTE: ``logger`` / ``is_running_in_aws`` are bound eagerly below, for the
+    # same submodule-shadowing reason documented in the summarizer package.
+}
+
+__all__ = sorted([*_EXPORTS, "is_running_in_aws", "logger"])
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily import and cache a public symbol on first access (PEP 562)."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = import_module(module_name, __name__)
+    value = getattr(module, name)
+    globals()[name] = value  # cache so subsequent access is a plain attribute lookup
+    return value
+
+
+def __dir__() -> list[str]:
+    return __all__
+
+
+# Eagerly bind the logger instance + is_running_in_aws (cheap shim) so they are
+# never shadowed by the same-named ``logger`` submodule via import-order races.
+from .logger import is_running_in_aws, logger  # noqa: E402, F401, I001
+
+
+if TYPE_CHECKING:  # pragma: no cover - import-time hints for type checkers only
+    from .aws_helpers import get_ssm_param_value, get_ssm_param_values
+    from .cleaner import Cleaner
+    from .constants import NULL_STRING, EnvVars, LocalPaths, SSMParams
+    from .logger import is_running_in_aws, logger
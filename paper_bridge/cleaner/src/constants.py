@@ -28,4 +28,5 @@ class LocalPaths(str, Enum):
     OUTPUTS_DIR = "outputs"
 
     CONFIG_FILE = "config.yaml"
+    CONFIG_SIDECAR_FILE = "config.json"
     LOGS_FILE = "logs.txt"
@@ -1,12 +1,13 @@
+import functools
 from enum import Enum
 from pathlib import Path
+from types import MappingProxyType
 from typing import Literal
 
-import yaml
 from dotenv import load_dotenv
-from pydantic import BaseModel, Field, FilePath
+from pydantic import BaseModel, ConfigDict, Field, FilePath
 
-from paper_bridge.shared import BaseModelWithDefaults, EnvVars, LanguageModelId
+from paper_bridge.shared import EnvVars, LanguageModelId, drop_none, yaml_loader
 
 
 class EmbeddingsModelId(str, Enum):
@@ -19,36 +20,49 @@ ModelIdType = EmbeddingsModelId | LanguageModelId
 
 
 class ModelInfo(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     dimensions: int | list[int] | None = Field(default=None)
     max_sequence_length: int = Field(gt=0)
 
 
-_MODEL_INFO: dict[ModelIdType, ModelInfo] = {
-    EmbeddingsModelId.COHERE_EMBED_TEXT_V3: ModelInfo(
-        dimensions=1024, max_sequence_length=512
-    ),
-    EmbeddingsModelId.TITAN_EMBED_TEXT_V1: ModelInfo(
-        dimensions=1536, max_sequence_length=8192
-    ),
-    EmbeddingsModelId.TITAN_EMBED_TEXT_V2: ModelInfo(
-        dimensions=[256, 384, 1024], max_sequence_length=8192
-    ),
-    LanguageModelId.CLAUDE_V3_HAIKU: ModelInfo(max_sequence_length=200000),
-    LanguageModelId.CLAUDE_V3_5_HAIKU: ModelInfo(max_sequence_length=200000),
-    LanguageModelId.CLAUDE_V3_5_SONNET: ModelInfo(max_sequence_length=200000),
-    LanguageModelId.CLAUDE_V3_5_SONNET_V2: ModelInfo(max_sequence_length=200000),
-    LanguageModelId.CLAUDE_V3_7_SONNET: ModelInfo(max_sequence_length=200000),
-    LanguageModelId.CLAUDE_V4_5_HAIKU: ModelInfo(max_sequence_length=200000),
-    LanguageModelId.CLAUDE_V4_SONNET: ModelInfo(max_sequence_length=200000),
-    LanguageModelId.CLAUDE_V4_5_SONNET: ModelInfo(max_sequence_length=200000),
-    LanguageModelId.CLAUDE_V4_6_SONNET: ModelInfo(max_sequence_length=200000),
-    LanguageModelId.CLAUDE_V4_OPUS: ModelInfo(max_sequence_length=200000),
-    LanguageModelId.CLAUDE_V4_1_OPUS: ModelInfo(max_sequence_length=200000),
-    LanguageModelId.CLAUDE_V4_5_OPUS: ModelInfo(max_sequence_length=200000),
-    LanguageModelId.CLAUDE_V4_6_OPUS: ModelInfo(max_sequence_length=200000),
-    LanguageModelId.CLAUDE_V4_7_OPUS: ModelInfo(max_sequence_length=200000),
-    LanguageModelId.CLAUDE_V4_8_OPUS: ModelInfo(max_sequence_length=200000),
-}
+# _MODEL_INFO and the Config default factories below are developer-written
+# literals, not external input, so they use model_construct() to skip validation
+# at import/default time. YAML input still goes through full validation in
+# Config.from_yaml; the config tests validate these literals once. The table is
+# shared process-wide, so it is exposed read-only.
+_trusted_info = ModelInfo.model_construct
+
+_MODEL_INFO: MappingProxyType[ModelIdType, ModelInfo] = MappingProxyType(
+    {
+        EmbeddingsModelId.COHERE_EMBED_TEXT_V3: _trusted_info(
+            dimensions=1024, max_sequence_length=512
+        ),
+        EmbeddingsModelId.TITAN_EMBED_TEXT_V1: _trusted_info(
+            dimensions=1536, max_sequence_length=8192
+        ),
+        EmbeddingsModelId.TITAN_EMBED_TEXT_V2: _trusted_info(
+            dimensions=[256, 384, 1024], max_sequence_length=8192
+        ),
+        LanguageModelId.CLAUDE_V3_HAIKU: _trusted_info(max_sequence_length=200000),
+        LanguageModelId.CLAUDE_V3_5_HAIKU: _trusted_info(max_sequence_length=200000),
+        LanguageModelId.CLAUDE_V3_5_SONNET: _trusted_info(max_sequence_length=200000),
+        LanguageModelId.CLAUDE_V3_5_SONNET_V2: _trusted_info(
+            max_sequence_length=200000
+        ),
+        LanguageModelId.CLAUDE_V3_7_SONNET: _trusted_info(max_sequence_length=200000),
+        LanguageModelId.CLAUDE_V4_5_HAIKU: _trusted_info(max_sequence_length=200000),
+        LanguageModelId.CLAUDE_V4_SONNET: _trusted_info(max_sequence_length=200000),
+        LanguageModelId.CLAUDE_V4_5_SONNET: _trusted_info(max_sequence_length=200000),
+        LanguageModelId.CLAUDE_V4_6_SONNET: _trusted_info(max_sequence_length=200000),
+        LanguageModelId.CLAUDE_V4_OPUS: _trusted_info(max_sequence_length=200000),
+        LanguageModelId.CLAUDE_V4_1_OPUS: _trusted_info(max_sequence_length=200000),
+        LanguageModelId.CLAUDE_V4_5_OPUS: _trusted_info(max_sequence_length=200000),
+        LanguageModelId.CLAUDE_V4_6_OPUS: _trusted_info(max_sequence_length=200000),
+        LanguageModelId.CLAUDE_V4_7_OPUS: _trusted_info(max_sequence_length=200000),
+        LanguageModelId.CLAUDE_V4_8_OPUS: _trusted_info(max_sequence_length=200000),
+    }
+)
 
 
 class ModelHandler:
@@ -96,7 +110,7 @@ class LocalPaths(str, Enum):
     PARSED_FILE = "parsed.json"
 
 
-class Resources(BaseModelWithDefaults):
+class Resources(BaseModel):
     project_name: str = Field(min_length=1)
     stage: Literal["dev", "prod"] = Field(default="dev")
     default_region_name: str = Field(default="us-west-2")
@@ -105,7 +119,7 @@ class Resources(BaseModelWithDefaults):
     s3_key_prefix: str | None = Field(default=None)
 
 
-class Indexing(BaseModelWithDefaults):
+class Indexing(BaseModel):
     papers_per_day: int = Field(default=5, ge=1)
     days_to_fetch: int = Field(default=7, ge=1)
     min_upvotes: int | None = Field(default=None, ge=0)
@@ -131,12 +145,12 @@ class Indexing(BaseModelWithDefaults):
     chunk_overlap: int = Field(default=128)
 
 
-class Config(BaseModelWithDefaults):
+class Config(BaseModel):
     resources: Resources = Field(
-        default_factory=lambda: Resources(project_name="paper-bridge")
+        default_factory=lambda: Resources.model_construct(project_name="paper-bridge")
     )
     indexing: Indexing = Field(
-        default_factory=lambda: Indexing(
+        default_factory=lambda: Indexing.model_construct(
             extraction_model_id=LanguageModelId.CLAUDE_V4_5_HAIKU,
             response_model_id=LanguageModelId.CLAUDE_V4_6_SONNET,
             embeddings_model_id=EmbeddingsModelId.COHERE_EMBED_TEXT_V3,
@@ -145,24 +159,43 @@ class Config(BaseModelWithDefaults):
 
     @classmethod
     def from_yaml(cls, file_path: str | Path | FilePath) -> "Config":
+        import yaml
+
         try:
-            with open(file_path, encoding="utf-8") as file:
-                config_data = yaml.safe_load(file) or {}
-            return cls(**config_data)
+            # One read; libyaml decodes UTF-8 bytes itself, skipping TextIOWrapper.
+            raw = Path(file_path).read_bytes()
+            config_data = yaml.load(raw, Loader=yaml_loader()) or {}
+            return cls(**drop_none(config_data))
         except (OSError, yaml.YAMLError) as e:
             raise ValueError(f"Failed to load config from {file_path}: {str(e)}") from e
 
     @classmethod
     def load(cls) -> "Config":
-        load_dotenv()
-        config_path = Path(__file__).parent / LocalPaths.CONFIG_FILE.value
-        config = cls() if not config_path.exists() else cls.from_yaml(config_path)
-
-        # The S3 bucket is account/region-specific (e.g.
-        # "sagemaker-us-west-2-<acct>"), so it must NOT be committed in
-        # config.yaml. Terraform injects it as S3_BUCKET_NAME into the Batch
-        # job; locally it comes from .env. The env value, when set, wins.
-        bucket = EnvVars.S3_BUCKET_NAME.env_value
-        if bucket:
-            config.resources.s3_bucket_name = bucket
-        return config
+        """Load the config once per process; later calls reuse the instance.
+
+        ``main`` and ``run_batch`` both call this, so repeat calls skip the
+        dotenv/YAML read and model validation. Use ``reload()`` to pick up a
+        changed config.yaml or environment.
+        """
+        return _load_config()
+
+    @classmethod
+    def reload(cls) -> "Config":
+        _load_config.cache_clear()
+        return _load_config()
+
+
+@functools.lru_cache(maxsize=1)
+def _load_config() -> Config:
+    load_dotenv()
+    config_path = Path(__file__).parent / LocalPaths.CONFIG_FILE.value
+    config = Config() if not config_path.exists() else Config.from_yaml(config_path)
+
+    # The S3 bucket is account/region-specific (e.g.
+    # "sagemaker-us-west-2-<acct>"), so it must NOT be committed in
+    # config.yaml. Terraform injects it as S3_BUCKET_NAME into the Batch
+    # job; locally it comes from .env. The env value, when set, wins.
+    bucket = EnvVars.S3_BUCKET_NAME.env_value
+    if bucket:
+        config.resources.s3_bucket_name = bucket
+    return config
@@ -1,12 +1,10 @@
 import argparse
 import sys
 from datetime import UTC, datetime, timedelta
-from pathlib import Path
 from pprint import pformat
 
 import boto3
 
-sys.path.append(str(Path(__file__).parent.parent.parent))
 from paper_bridge.indexer.configs import Config
 from paper_bridge.indexer.src import (
     NULL_STRING,
@@ -21,7 +19,7 @@ from paper_bridge.indexer.src import (
 # which is ambiguous with the ``logger`` submodule depending on import order —
 # see the note in summarizer/main.py.
 from paper_bridge.indexer.src.logger import logger
-from paper_bridge.shared import format_alarm
+from paper_bridge.shared import format_alarm, is_iso_date
 
 
 class DateFormatError(Exception):
@@ -117,7 +115,9 @@ def parse_target_date(date_str: str | None) -> datetime | None:
     if not date_str or date_str.lower() == NULL_STRING:
         return None
     try:
-        return datetime.strptime(date_str, "%Y-%m-%d")
+        if not is_iso_date(date_str):
+            raise ValueError(f"'{date_str}' does not match 'YYYY-MM-DD'")
+        return datetime.fromisoformat(date_str)
     except ValueError as e:
         logger.error("Invalid date format: %s", e)
         raise DateFormatError(f"Invalid date format: {e}") from e
@@ -157,11 +157,10 @@ def send_failure_notification(
 ) -> None:
     sns = boto3_session.client("sns")
     date_str = get_formatted_date(target_date)
-    paper_ids = [paper.arxiv_id for paper in papers]
 
     fields = {"Date": date_str}
-    if paper_ids:
-        fields["Paper IDs"] = ", ".join(paper_ids)
+    if papers:
+        fields["Paper IDs"] = ", ".join(paper.arxiv_id for paper in papers)
     fields["Error"] = error_message or "Unknown error"
 
     subject, message = format_alarm(event="Indexer", status="FAILED", fields=fields)
@@ -172,12 +171,7 @@ def get_formatted_date(target_date: datetime | None) -> str:
     if target_date:
         return target_date.strftime("%Y-%m-%d")
 
-    return (
-        datetime.now(UTC)
-        .replace(hour=0, minute=0, second=0, microsecond=0)
-        .astimezone(UTC)
-        - timedelta(days=1)
-    ).strftime("%Y-%m-%d")
+    return (datetime.now(UTC).date() - timedelta(days=1)).isoformat()
 
 
 if __name__ == "__main__":
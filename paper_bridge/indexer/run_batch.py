@@ -1,18 +1,16 @@
 import argparse
 import sys
 from datetime import UTC, datetime
-from pathlib import Path
 from typing import Any
 
 import boto3
 
-sys.path.append(str(Path(__file__).parent.parent.parent))
 from paper_bridge.indexer.configs import Config
 from paper_bridge.indexer.src import (
     NULL_STRING,
     EnvVars,
     SSMParams,
-    get_ssm_param_value,
+    get_ssm_param_values,
     logger,
     submit_batch_job,
     wait_for_batch_job_completion,
@@ -81,18 +79,12 @@ def sanitize_parameters(params: dict[str, Any]) -> dict[str, str]:
 def get_batch_job_names(
     boto3_session: boto3.Session,
     config: Config,
-) -> tuple[str | None, str | None]:
+) -> tuple[str, str]:
     base_path = f"/{config.resources.project_name}-{config.resources.stage}"
-    return (
-        get_ssm_param_value(
-            boto3_session,
-            f"{base_path}/{SSMParams.BATCH_JOB_QUEUE_INDEXER.value}",
-        ),
-        get_ssm_param_value(
-            boto3_session,
-            f"{base_path}/{SSMParams.BATCH_JOB_DEFINITION_INDEXER.value}",
-        ),
-    )
+    queue_param = f"{base_path}/{SSMParams.BATCH_JOB_QUEUE_INDEXER.value}"
+    definition_param = f"{base_path}/{SSMParams.BATCH_JOB_DEFINITION_INDEXER.value}"
+    values = get_ssm_param_values(boto3_session, [queue_param, definition_param])
+    return values[queue_param], values[definition_param]
 
 
 if __name__ == "__main__":
@@ -1,35 +1,73 @@
-from paper_bridge.indexer.src.aws_helpers import (
-    NeptuneClient,
-    OpenSearchClient,
-    get_ssm_param_value,
-    submit_batch_job,
-    wait_for_batch_job_completion,
-)
-from paper_bridge.indexer.src.constants import (
-    NULL_STRING,
-    EnvVars,
-    LocalPaths,
-    SSMParams,
-)
-from paper_bridge.indexer.src.fetcher import Paper, PaperFetcher
-from paper_bridge.indexer.src.indexer import run_extract_and_build
-from paper_bridge.indexer.src.logger import is_aws_env, logger
-from paper_bridge.indexer.src.utils import HTMLTagOutputParser, arg_as_bool
-
-__all__ = [
-    "EnvVars",
-    "HTMLTagOutputParser",
-    "LocalPaths",
-    "NeptuneClient",
-    "NULL_STRING",
-    "OpenSearchClient",
-    "Paper",
-    "PaperFetcher",
-    "SSMParams",
-    "get_ssm_param_value",
-    "is_aws_env",
-    "logger",
-    "run_extract_and_build",
-    "submit_batch_job",
-    "wait_for_batch_job_completion",
-]
+"""Indexer package.
+
+Public symbols are exported lazily (PEP 562) so importing a light-weight module
+(the constants, logger or the SSM/Batch helpers used by ``run_batch``) does not
+eagerly pull in graphrag-toolkit and llama-index behind ``fetcher``/``indexer``.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+# Map each public symbol to the submodule that defines it.
+_EXPORTS: dict[str, str] = {
+    # aws_helpers (imports the shared Neptune/OpenSearch clients)
+    "NeptuneClient": ".aws_helpers",
+    "OpenSearchClient": ".aws_helpers",
+    "get_ssm_param_value": ".aws_helpers",
+    "get_ssm_param_values": ".aws_helpers",
+    "submit_batch_job": ".aws_helpers",
+    "wait_for_batch_job_completion": ".aws_helpers",
+    # constants
+    "EnvVars": ".constants",
+    "LocalPaths": ".constants",
+    "NULL_STRING": ".constants",
+    "SSMParams": ".constants",
+    # fetcher (heavy)
+    "Paper": ".fetcher",
+    "PaperFetcher": ".fetcher",
+    # indexer (heavy)
+    "run_extract_and_build": ".indexer",
+    # utils
+    "HTMLTagOutputParser": ".utils",
+    "arg_as_bool": ".utils",
+    # NOTE: ``logger`` / ``is_aws_env`` are bound eagerly below, for the same
+    # submodule-shadowing reason documented in the summarizer package.
+}
+
+__all__ = sorted([*_EXPORTS, "is_aws_env", "logger"])
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily import and cache a public symbol on first access (PEP 562)."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = import_module(module_name, __name__)
+    value = getattr(module, name)
+    globals()[name] = value  # cache so subsequent access is a plain attribute lookup
+    return value
+
+
+def __dir__() -> list[str]:
+    return __all__
+
+
+# Eagerly bind the logger instance + is_aws_env (cheap shim) so they are never
+# shadowed by the same-named ``logger`` submodule via import-order races.
+from .logger import is_aws_env, logger  # noqa: E402, F401, I001
+
+
+if TYPE_CHECKING:  # pragma: no cover - import-time hints for type checkers only
+    from .aws_helpers import (
+        NeptuneClient,
+        OpenSearchClient,
+        get_ssm_param_value,
+        get_ssm_param_values,
+        submit_batch_job,
+        wait_for_batch_job_completion,
+    )
+    from .constants import NULL_STRING, EnvVars, LocalPaths, SSMParams
+    from .fetcher import Paper, PaperFetcher
+    from .indexer import run_extract_and_build
+    from .logger import is_aws_env, logger
+    from .utils import HTMLTagOutputParser, arg_as_bool
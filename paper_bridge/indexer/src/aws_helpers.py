@@ -3,15 +3,18 @@ import time
 import boto3
 from botocore.exceptions import ClientError
 
-# NeptuneClient/OpenSearchClient now live in paper_bridge.shared as a single
-# implementation shared with the cleaner (they had drifted into two divergent
+# NeptuneClient/OpenSearchClient and the SSM helpers (shared with the cleaner)
+# and get_cross_inference_model_id (shared with the summarizer) now live in
+# paper_bridge.shared as single implementations (they had drifted into divergent
 # copies). Re-exported here so existing imports
 # (``from .aws_helpers import NeptuneClient``) keep working.
+from paper_bridge.shared.bedrock import get_cross_inference_model_id
 from paper_bridge.shared.neptune_client import (
     NeptuneClient,
     summarize_deletion_results,
 )
 from paper_bridge.shared.opensearch_client import OpenSearchClient
+from paper_bridge.shared.ssm import get_ssm_param_value, get_ssm_param_values
 
 from .logger import logger
 
@@ -22,6 +25,7 @@ __all__ = [
     "get_account_id",
     "get_cross_inference_model_id",
     "get_ssm_param_value",
+    "get_ssm_param_values",
     "submit_batch_job",
     "wait_for_batch_job_completion",
 ]
@@ -36,43 +40,6 @@ def get_account_id(boto3_session: boto3.Session) -> str:
         raise
 
 
-def get_cross_inference_model_id(
-    boto3_session: boto3.Session, model_id: str, region_name: str
-) -> str:
-    if not all([boto3_session, model_id, region_name]):
-        raise ValueError("All parameters must be provided")
-
-    prefix = "apac" if region_name.startswith("ap-") else region_name[:2]
-    cr_model_id = f"{prefix}.{model_id}"
-
-    try:
-        bedrock_client = boto3_session.client("bedrock", region_name=region_name)
-        response = bedrock_client.list_inference_profiles(
-            maxResults=1000, typeEquals="SYSTEM_DEFINED"
-        )
-        profile_list = [
-            p["inferenceProfileId"] for p in response["inferenceProfileSummaries"]
-        ]
-
-        if cr_model_id in profile_list:
-            return cr_model_id
-
-    except Exception as e:
-        logger.error("Error checking cross-inference support: %s", str(e))
-
-    return model_id
-
-
-def get_ssm_param_value(boto3_session: boto3.Session, param_name: str) -> str:
-    ssm_client = boto3_session.client("ssm")
-    try:
-        response = ssm_client.get_parameter(Name=param_name, WithDecryption=True)
-        return response["Parameter"]["Value"]
-    except ClientError as error:
-        logger.error("Failed to get SSM parameter value: %s", str(error))
-        raise error
-
-
 def submit_batch_job(
     boto3_session: boto3.Session,
     job_name: str,
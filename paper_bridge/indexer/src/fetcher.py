@@ -1,7 +1,9 @@
 import os
 import re
 import tempfile
+import threading
 import time
+from collections import Counter
 from collections.abc import Sequence
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import UTC, datetime, timedelta
@@ -16,7 +18,9 @@ from llama_index.llms.bedrock_converse import BedrockConverse
 from llama_parse import LlamaParse
 from llama_parse.base import ResultType
 from pydantic import BaseModel, Field, HttpUrl, field_validator
+from requests.adapters import HTTPAdapter
 from unstructured.partition.pdf import partition_pdf
+from urllib3.util import Retry
 
 from paper_bridge.indexer.configs.config import Config
 from paper_bridge.shared import PaperScorer, SelectionConfig
@@ -29,6 +33,39 @@ from .logger import is_aws_env, logger
 from .prompts import MainContentExtractionPrompt
 from .utils import HTMLTagOutputParser, measure_execution_time
 
+# Stand-alone section headings, with optional markdown/numbering ("## 1
+# Introduction", "I. INTRODUCTION", ...). The main content starts at the
+# introduction and, as in MainContentExtractionPrompt, ends before whichever of
+# acknowledgments/references/bibliography (or an appendix) comes first.
+_HEADING_PREFIX = r"^[ \t#*]*(?:(?:\d+|[IVX]+)\.?[ \t]+)?"
+_INTRODUCTION_HEADING = re.compile(
+    _HEADING_PREFIX + r"Introduction[ \t*:]*$", re.IGNORECASE | re.MULTILINE
+)
+_END_OF_BODY_HEADING = re.compile(
+    _HEADING_PREFIX
+    + r"(?:Acknowledge?ments?|References|Bibliography"
+    + r"|Appendix(?:[ \t]+[A-Z])?|Appendices)[ \t*:]*$",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+
+def _find_heading_range(text: str, min_length: int) -> tuple[int, int] | None:
+    """Locate the main content by its section headings, without the LLM.
+
+    Returns ``(start, end)`` from the Introduction heading to the first
+    end-of-body heading at least ``min_length`` characters later, or ``None`` if
+    either cannot be found.
+    """
+    start_match = _INTRODUCTION_HEADING.search(text)
+    if not start_match:
+        return None
+
+    end_match = _END_OF_BODY_HEADING.search(text, start_match.start() + min_length)
+    if not end_match:
+        return None
+
+    return start_match.start(), end_match.start()
+
 
 class PaperStatus(Enum):
     FAILED = auto()
@@ -82,6 +119,7 @@ class PaperFetcher:
     DEFAULT_TIMEOUT: int = 10
     MAX_RETRIES: int = 3
     RETRY_DELAY: int = 1
+    MAX_RETRY_DELAY: int = 30
     MAX_WORKERS: int = 4
     MIN_PAPERS_PER_DAY: int = 1
     MIN_DAYS_TO_FETCH: int = 1
@@ -118,6 +156,7 @@ class PaperFetcher:
             else None
         )
         self.timeout = max(1, timeout)
+        self._http = self._create_http_session()
         self._scorer = PaperScorer(
             SelectionConfig(
                 popularity_weight=config.indexing.selection_popularity_weight,
@@ -143,6 +182,9 @@ class PaperFetcher:
         self.prompt = None
         self.llm = None
         self.output_parser = None
+        # How each paper's main content was bounded: "headings" or "llm".
+        self._extraction_counts: Counter[str] = Counter()
+        self._extraction_counts_lock = threading.Lock()
 
         if config.indexing.main_content_extraction_model_id:
             self.prompt = MainContentExtractionPrompt.get_prompt()
@@ -188,6 +230,10 @@ class PaperFetcher:
     @staticmethod
     def _fetch_papers_by_arxiv_ids(arxiv_ids: list[str]) -> list[Paper]:
         logger.info("Fetching papers by arXiv IDs: '%s'", arxiv_ids)
+        # Drop repeated ids (order-preserving) so each paper is downloaded and
+        # parsed once; the date-range path already de-duplicates in
+        # _select_papers.
+        arxiv_ids = list(dict.fromkeys(arxiv_ids))
         # ONE batched, serialized API call for all ids (see shared.arxiv_client),
         # instead of a per-id loop that triggered 429s.
         metadata = fetch_arxiv_metadata(arxiv_ids)
@@ -246,6 +292,13 @@ class PaperFetcher:
                     logger.error(f"Error processing paper {paper.arxiv_id}: {str(e)}")
                     paper.status = PaperStatus.FAILED
 
+        if self._extraction_counts:
+            logger.info(
+                "Main content bounded by section headings for %d paper(s), "
+                "by the LLM for %d",
+                self._extraction_counts["headings"],
+                self._extraction_counts["llm"],
+            )
         return papers
 
     @measure_execution_time
@@ -290,11 +343,16 @@ class PaperFetcher:
         start_date = end_date - timedelta(days=days - 1)
         logger.info("Fetching papers from '%s' to '%s'", start_date, end_date)
 
-        for current_date in self._date_range(start_date, end_date):
-            date_str = current_date.strftime("%Y-%m-%d")
-            papers = self._fetch_daily_papers(date_str, current_date)
-            if papers:
-                papers_by_date[current_date.date().isoformat()] = papers
+        # One independent HF API call per day; map() keeps the results in date order.
+        dates = self._date_range(start_date, end_date)
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            daily_papers = executor.map(
+                lambda day: self._fetch_daily_papers(day.strftime("%Y-%m-%d"), day),
+                dates,
+            )
+            for current_date, papers in zip(dates, daily_papers, strict=True):
+                if papers:
+                    papers_by_date[current_date.date().isoformat()] = papers
 
         return papers_by_date
 
@@ -312,27 +370,44 @@ class PaperFetcher:
 
         papers = []
         for paper_data in response.json():
-            if paper := self._process_paper_metadata(paper_data, current_date):
+            if paper := self._process_paper_metadata(
+                paper_data, current_date, date_str
+            ):
                 papers.append(paper)
         return papers
 
+    def _create_http_session(self) -> requests.Session:
+        # Shared keep-alive pool for the per-day HF API calls. urllib3 retries
+        # connection errors and 429/5xx with jittered exponential backoff, honoring
+        # Retry-After; other 4xx fail fast.
+        retry = Retry(
+            total=self.MAX_RETRIES - 1,
+            backoff_factor=self.RETRY_DELAY,
+            backoff_jitter=self.RETRY_DELAY / 2,
+            backoff_max=self.MAX_RETRY_DELAY,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset({"GET"}),
+            raise_on_status=False,
+        )
+        session = requests.Session()
+        session.mount(
+            "https://", HTTPAdapter(max_retries=retry, pool_maxsize=self.MAX_WORKERS)
+        )
+        return session
+
     def _make_request(self, url: str) -> requests.Response | None:
-        for attempt in range(self.MAX_RETRIES):
-            try:
-                response = requests.get(url, timeout=self.timeout)
-                response.raise_for_status()
-                return response
-            except requests.RequestException as e:
-                if attempt == self.MAX_RETRIES - 1:
-                    logger.error(
-                        f"Failed to fetch data after {self.MAX_RETRIES} attempts: {e}"
-                    )
-                    return None
-                time.sleep(self.RETRY_DELAY * (2**attempt))
-        return None
+        try:
+            response = self._http.get(url, timeout=self.timeout)
+            response.raise_for_status()
+            return response
+        except requests.RequestException as e:
+            logger.error(
+                "Failed to fetch data after %d attempts: %s", self.MAX_RETRIES, str(e)
+            )
+            return None
 
     def _process_paper_metadata(
-        self, paper_data: dict[str, Any], current_date: datetime
+        self, paper_data: dict[str, Any], current_date: datetime, base_date: str
     ) -> Paper | None:
         try:
             published_at = self._parse_date(paper_data.get("publishedAt"))
@@ -348,7 +423,7 @@ class PaperFetcher:
                 upvotes=paper_info["upvotes"],
                 thumbnail=paper_info.get("thumbnail"),
                 pdf_url=HttpUrl(f"{URLs.ARXIV_PDF.url}/{paper_info['id']}"),
-                base_date=current_date.strftime("%Y-%m-%d"),
+                base_date=base_date,
             )
             if self._meets_upvote_threshold(paper.upvotes):
                 return paper
@@ -362,7 +437,8 @@ class PaperFetcher:
         if not date_str:
             return None
         try:
-            return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+            # Python 3.11+ parses the trailing "Z" (UTC) natively.
+            return datetime.fromisoformat(date_str)
         except ValueError:
             logger.error(f"Invalid date format: {date_str}")
             return None
@@ -504,6 +580,14 @@ class PaperFetcher:
         if not self.prompt or not self.llm or not self.output_parser:
             return text_content.strip()
 
+        # Most papers have plain Introduction/References headings; only fall back
+        # to the LLM when they cannot be located.
+        content_range = _find_heading_range(text_content, self.CONTENT_OFFSET)
+        self._count_extraction("headings" if content_range else "llm")
+        if content_range:
+            start_idx, end_idx = content_range
+            return text_content[start_idx:end_idx].strip()
+
         try:
             messages = self.prompt.format_messages(
                 text=text_content[: self.MAX_CONTENT_CHARS]
@@ -526,6 +610,10 @@ class PaperFetcher:
             logger.error(f"Error extracting main content: {str(e)}")
             return text_content.strip()
 
+    def _count_extraction(self, method: str) -> None:
+        with self._extraction_counts_lock:
+            self._extraction_counts[method] += 1
+
     def _find_content_range(
         self, text_content: str, markers: dict[str, str]
     ) -> tuple[int, int] | None:
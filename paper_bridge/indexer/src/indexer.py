@@ -48,6 +48,7 @@ from .aws_helpers import (
     get_account_id,
     get_cross_inference_model_id,
     get_ssm_param_value,
+    get_ssm_param_values,
     summarize_deletion_results,
 )
 from .constants import ENTITY_CLASSIFICATIONS, SSMParams
@@ -432,28 +433,25 @@ def _setup_stores(
     boto3_session: boto3.Session,
 ) -> tuple[GraphStore, VectorStore, NeptuneClient, list[OpenSearchClient]]:
     base_path = f"/{config.resources.project_name}-{config.resources.stage}"
-    graph_endpoint = get_ssm_param_value(
-        boto3_session, f"{base_path}/{SSMParams.NEPTUNE_ENDPOINT.value}"
-    )
-    vector_endpoint = get_ssm_param_value(
-        boto3_session, f"{base_path}/{SSMParams.OPENSEARCH_ENDPOINT.value}"
-    )
-    if graph_endpoint is None or vector_endpoint is None:
-        raise ValueError("Graph or vector endpoint not found")
+    graph_param = f"{base_path}/{SSMParams.NEPTUNE_ENDPOINT.value}"
+    vector_param = f"{base_path}/{SSMParams.OPENSEARCH_ENDPOINT.value}"
+    # One GetParameters round-trip for both endpoints; raises if either is missing.
+    endpoints = get_ssm_param_values(boto3_session, [graph_param, vector_param])
+    graph_endpoint = endpoints[graph_param]
+    vector_endpoint = endpoints[vector_param]
 
     graph_store = GraphStoreFactory.for_graph_store(f"neptune-db://{graph_endpoint}")
     vector_store = VectorStoreFactory.for_vector_store(f"aoss://{vector_endpoint}")
 
     neptune_client = NeptuneClient(graph_endpoint)
-    open_search_clients = [
-        OpenSearchClient(
+    open_search_clients = list(
+        OpenSearchClient.for_indexes(
             vector_endpoint.replace("http://", "").replace("https://", ""),
             443,
-            index,
+            ["chunk", "statement"],
             boto3_session,
             config.resources.default_region_name,
-        )
-        for index in ["chunk", "statement"]
-    ]
+        ).values()
+    )
 
     return graph_store, vector_store, neptune_client, open_search_clients
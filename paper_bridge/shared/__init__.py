@@ -1,6 +1,6 @@
 """Shared utilities and constants for Paper Bridge modules."""
 
-from .base_models import BaseModelWithDefaults
+from .base_models import drop_none, none_to_default, yaml_loader
 from .constants import (
     NULL_STRING,
     AutoNamedEnum,
@@ -20,11 +20,17 @@ from .paper_selection import (
     SelectionConfig,
 )
 from .prompt_caching import apply_cache_point, prompt_caching_supported
-from .text_utils import convert_markdown_to_slack_links, extract_unique_urls
+from .text_utils import (
+    convert_markdown_to_slack_links,
+    extract_unique_urls,
+    is_iso_date,
+)
 
 __all__ = [
     # Base models
-    "BaseModelWithDefaults",
+    "drop_none",
+    "none_to_default",
+    "yaml_loader",
     # Constants
     "NULL_STRING",
     "AutoNamedEnum",
@@ -43,6 +49,7 @@ __all__ = [
     # Text utils
     "convert_markdown_to_slack_links",
     "extract_unique_urls",
+    "is_iso_date",
     # Paper selection
     "PaperLike",
     "PaperScorer",
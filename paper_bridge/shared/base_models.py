@@ -1,23 +1,62 @@
-"""Base Pydantic models with enhanced default handling."""
+"""Loading and ``None``-to-default helpers for YAML-loaded Pydantic models."""
 
+import functools
+import logging
 from typing import Any
 
-from pydantic import BaseModel, model_validator
+from pydantic import BaseModel, ValidationInfo
 
+# Module logger inherits the handlers/level configured by the importing app.
+logger = logging.getLogger(__name__)
 
-class BaseModelWithDefaults(BaseModel):
-    """Base model that replaces None values with field defaults during validation.
 
-    This is useful when loading configuration from YAML files where missing fields
-    are represented as None rather than being absent.
+# PyYAML is imported lazily so that importing paper_bridge.shared does not pull it
+# in for callers that never parse YAML (e.g. the cleaner Lambda, which reads its
+# prebuilt JSON sidecar).
+@functools.cache
+def yaml_loader() -> Any:
+    """Return libyaml's C loader, which parses several times faster than the
+    pure-Python SafeLoader. PyYAML wheels ship with libyaml; fall back (loudly)
+    if this build lacks it.
     """
+    try:
+        from yaml import CSafeLoader
 
-    @model_validator(mode="before")
-    @classmethod
-    def set_defaults_for_none_fields(cls, values: dict[str, Any]) -> dict[str, Any]:
-        if not isinstance(values, dict):
-            return values
-        for field_name, field in cls.model_fields.items():
-            if values.get(field_name) is None and field.default is not None:
-                values[field_name] = field.default
-        return values
+        return CSafeLoader
+    except ImportError:  # pragma: no cover - depends on the PyYAML build
+        from yaml import SafeLoader
+
+        logger.warning("libyaml is unavailable; falling back to the pure-Python loader")
+        return SafeLoader
+
+
+def drop_none(data: Any) -> Any:
+    """Recursively drop ``None``-valued keys from loaded config data.
+
+    YAML renders a key with no value (``days_back:``) as ``None``; dropping it lets
+    the model fall back to the field default (or default factory) and makes a
+    missing required field fail as "Field required". List items are kept as is.
+    """
+    if isinstance(data, dict):
+        return {
+            key: drop_none(value) for key, value in data.items() if value is not None
+        }
+    if isinstance(data, list):
+        return [drop_none(item) for item in data]
+    return data
+
+
+def none_to_default(cls: type[BaseModel], value: Any, info: ValidationInfo) -> Any:
+    """``mode="before"`` field validator mapping an explicit ``None`` to the default.
+
+    Reuse it per model with
+    ``_none_to_default = field_validator("*", mode="before")(none_to_default)``.
+    It runs only for fields present in the input and never mutates that input.
+    Required fields keep their ``None`` so they fail validation as usual.
+    """
+    if value is not None or info.field_name is None:
+        return value
+    field = cls.model_fields[info.field_name]
+    if field.is_required():
+        return value
+    return field.get_default(call_default_factory=True)
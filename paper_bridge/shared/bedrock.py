@@ -0,0 +1,56 @@
+"""Shared Bedrock helpers.
+
+Single implementation of the cross-region inference-profile lookup used by both
+the indexer and the summarizer (previously two identical copies in their
+``aws_helpers.py``).
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import boto3
+
+# Module logger inherits the handlers/level configured by the importing app.
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=8)
+def _system_inference_profiles(
+    boto3_session: boto3.Session, region_name: str
+) -> frozenset[str]:
+    """Return the SYSTEM_DEFINED inference-profile ids available in a region.
+
+    The list only changes when AWS ships a new profile, so it is fetched once per
+    session and region instead of on every model lookup. A failed call raises and
+    is therefore not cached.
+    """
+    bedrock_client = boto3_session.client("bedrock", region_name=region_name)
+    response = bedrock_client.list_inference_profiles(
+        maxResults=1000, typeEquals="SYSTEM_DEFINED"
+    )
+    return frozenset(
+        p["inferenceProfileId"] for p in response["inferenceProfileSummaries"]
+    )
+
+
+def get_cross_inference_model_id(
+    boto3_session: boto3.Session, model_id: str, region_name: str
+) -> str:
+    if not all([boto3_session, model_id, region_name]):
+        raise ValueError("All parameters must be provided")
+
+    prefix = "apac" if region_name.startswith("ap-") else region_name[:2]
+    cr_model_id = f"{prefix}.{model_id}"
+
+    try:
+        if cr_model_id in _system_inference_profiles(boto3_session, region_name):
+            return cr_model_id
+
+    except Exception as e:
+        logger.error("Error checking cross-inference support: %s", str(e))
+
+    return model_id
@@ -1,5 +1,6 @@
 """Shared logging configuration for Paper Bridge modules."""
 
+import functools
 import logging
 import os
 import sys
@@ -28,9 +29,8 @@ class _FlushingStreamHandler(logging.StreamHandler):
         self.flush()
 
 
-def is_aws_env() -> bool:
-    """Check if the code is running in an AWS environment (Lambda, ECS, Batch)."""
-    aws_env_vars = [
+_AWS_ENV_VARS: frozenset[str] = frozenset(
+    {
         "AWS_BATCH_JOB_ID",
         "AWS_ECS_CONTAINER_METADATA_URI",
         "AWS_ECS_CONTAINER_METADATA_URI_V4",
@@ -38,8 +38,19 @@ def is_aws_env() -> bool:
         "AWS_LAMBDA_FUNCTION_NAME",
         "AWS_LAMBDA_RUNTIME_API",
         "ECS_CONTAINER_METADATA_URI",
-    ]
-    return any(env_var in os.environ for env_var in aws_env_vars)
+    }
+)
+
+
+@functools.cache
+def is_aws_env() -> bool:
+    """Check if the code is running in an AWS environment (Lambda, ECS, Batch).
+
+    The runtime-injected variables never change within a container, so the
+    answer is computed once; call ``is_aws_env.cache_clear()`` after changing
+    them (e.g. in tests).
+    """
+    return not _AWS_ENV_VARS.isdisjoint(os.environ)
 
 
 class LoggerConfig:
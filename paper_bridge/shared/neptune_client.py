@@ -20,11 +20,13 @@ from __future__ import annotations
 import logging
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from gremlin_python.driver import client, serializer
 
 from .graph_schema import Edge, Vertex
+from .text_utils import is_iso_date
 
 # Use a module logger that inherits the handlers/level configured by whichever
 # app (indexer/cleaner) imports this; avoids each app having to inject its own.
@@ -40,11 +42,6 @@ _MEM_RETRY_BASE_DELAY = 3  # seconds; exponential: 3, 6, 12, 24, 48, ...
 # A paper_id is inlined into Gremlin (bindings unsupported on this endpoint), so
 # it must be validated to a safe character set to prevent query injection.
 _PAPER_ID_RE = re.compile(r"^[a-zA-Z0-9_.:-]+$")
-_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
-
-
-def _is_valid_date_format(date_str: str) -> bool:
-    return bool(date_str) and bool(_DATE_RE.match(date_str))
 
 
 def summarize_deletion_results(
@@ -71,6 +68,15 @@ class NeptuneClient:
     # g.V(id...).drop() stays well under the Neptune Serverless memory limit.
     _DROP_BATCH_SIZE = 50
 
+    # Papers deleted concurrently by ``batch_delete_documents``. Kept at 1: the
+    # shared-node ownership test (see ``delete_document``) snapshots owners
+    # before dropping, so two papers that share a fact and are deleted at the
+    # same time each see the other's statement as a surviving owner and both
+    # keep the fact — a permanent orphan. Sequentially, the second paper sees
+    # the first one's statements already gone and reclaims it. Raise this only
+    # for batches known not to share facts.
+    MAX_WORKERS: int = 1
+
     def __init__(self, neptune_endpoint: str):
         if not neptune_endpoint:
             raise ValueError("Neptune endpoint must be provided.")
@@ -83,8 +89,16 @@ class NeptuneClient:
         if not self._gremlin_client:
             try:
                 url = f"{self.DEFAULT_PROTOCOL}://{self.endpoint}:{self.DEFAULT_PORT}/gremlin"
+                # Size the websocket pool to the deletion concurrency. The pool
+                # is a FIFO queue whose connections handshake lazily, so the
+                # driver default of 8 makes even sequential submits rotate
+                # through (and TLS-handshake) 8 sockets before reusing one.
                 self._gremlin_client = client.Client(
-                    url, "g", message_serializer=serializer.GraphSONSerializersV2d0()
+                    url,
+                    "g",
+                    pool_size=self.MAX_WORKERS,
+                    max_workers=self.MAX_WORKERS,
+                    message_serializer=serializer.GraphSONSerializersV2d0(),
                 )
             except Exception as e:
                 logger.error("Failed to initialize Neptune client: %s", e)
@@ -104,9 +118,10 @@ class NeptuneClient:
         query succeeds once capacity is available; other errors propagate
         immediately. ``sleep`` is injectable for tests.
         """
+        gremlin = self.client  # resolve the lazy property once, not per attempt
         for attempt in range(_MEM_RETRY_MAX):
             try:
-                return self.client.submit(query, bindings=bindings).all().result()
+                return gremlin.submit(query, bindings=bindings).all().result()
             except Exception as e:
                 if _MEM_LIMIT_MARKER not in str(e) or attempt == _MEM_RETRY_MAX - 1:
                     raise
@@ -138,7 +153,14 @@ class NeptuneClient:
         statement/fact ids) — i.e. no other paper still uses it. This is the
         correct test for "owned only by this paper"; a Gremlin count() cannot
         express it (it would also count this paper's own repeated references).
+
+        With an empty ``owned`` set nothing can qualify, so the query is skipped:
+        a paper with no statements (e.g. a retry after chunks were already
+        dropped) never reaches the facts, and one with no owned facts never
+        reaches the entities.
         """
+        if not owned:
+            return []
         result = self._submit_query(project_query)
         rows = result[0] if result and result[0] else []
         kept: list[Any] = []
@@ -215,16 +237,24 @@ class NeptuneClient:
             # we collect each shared candidate together with ALL of its owners and
             # decide in Python: delete iff its owner set is a SUBSET of this
             # paper's collected statement/fact ids.
-            chunks = f"{base_query}.in('{ef}').dedup()"
-            statements = f"{chunks}.in('{mi}').dedup().hasLabel('{stmt}')"
-            simple_queries = {
-                "chunks": f"{chunks}.id().fold()",
-                "statements": f"{statements}.id().fold()",
-                "topics": (
-                    f"{statements}.out('{bt}').dedup().hasLabel('{topic}')"
-                    ".id().fold()"
-                ),
-            }
+            chunk_hop = f".in('{ef}').dedup()"
+            statement_hop = f".in('{mi}').dedup().hasLabel('{stmt}')"
+            topic_hop = f".out('{bt}').dedup().hasLabel('{topic}')"
+            statements = f"{base_query}{chunk_hop}{statement_hop}"
+            # The three per-source stages are collected in ONE submit: project()
+            # over the folded source vertices runs each id-collecting branch
+            # server-side and returns {'chunks': [...], 'statements': [...],
+            # 'topics': [...]}, saving two WSS round-trips per paper. fold() first
+            # so duplicate sources for a paper_id yield one merged map, and every
+            # branch keeps its per-hop dedup.
+            per_source_stages = ("chunks", "statements", "topics")
+            per_source_query = (
+                f"{base_query}.fold()"
+                f".project('chunks', 'statements', 'topics')"
+                f".by(unfold(){chunk_hop}.id().fold())"
+                f".by(unfold(){chunk_hop}{statement_hop}.id().fold())"
+                f".by(unfold(){chunk_hop}{statement_hop}{topic_hop}.id().fold())"
+            )
             # For facts/entities: project (candidate_id, [owner_ids]) so Python
             # can keep only those wholly owned by this paper.
             fact_owners_query = (
@@ -265,20 +295,21 @@ class NeptuneClient:
             errors: list[str] = []
             ids_by_stage: dict[str, list[Any]] = {}
 
-            # Phase 1a: per-source stages (chunks/statements/topics).
-            for name, query in simple_queries.items():
-                try:
-                    logger.info("Collecting '%s' ids for paper_id '%s'", name, paper_id)
-                    result = self._submit_query(query)
-                    ids_by_stage[name] = result[0] if result and result[0] else []
+            # Phase 1a: per-source stages (chunks/statements/topics), one submit.
+            try:
+                logger.info("Collecting per-source ids for paper_id '%s'", paper_id)
+                result = self._submit_query(per_source_query)
+                row = result[0] if result and result[0] else {}
+                for name in per_source_stages:
+                    ids_by_stage[name] = row.get(name) or []
                     logger.info("Collected %d '%s' ids", len(ids_by_stage[name]), name)
-                except Exception as e:
-                    logger.error(
-                        "Failed to collect '%s' for paper_id '%s': %s",
-                        name,
-                        paper_id,
-                        e,
-                    )
+            except Exception as e:
+                logger.error(
+                    "Failed to collect per-source ids for paper_id '%s': %s",
+                    paper_id,
+                    e,
+                )
+                for name in per_source_stages:
                     deleted[name] = "error"
                     errors.append(name)
 
@@ -357,16 +388,23 @@ class NeptuneClient:
             logger.warning("No 'paper_id's provided for batch deletion.")
             return []
 
-        results = []
-        for paper_id in paper_ids:
-            try:
-                results.append(self.delete_document(paper_id))
-            except Exception as e:
-                logger.error("Failed to delete document '%s': %s", paper_id, e)
-                results.append(
-                    {"status": "error", "paper_id": paper_id, "error": str(e)}
-                )
-        return results
+        max_workers = min(self.MAX_WORKERS, len(paper_ids))
+        if max_workers <= 1:
+            return [self._delete_document_safely(p) for p in paper_ids]
+
+        # Build the gremlin client up front so worker threads share one instead
+        # of racing the lazy ``client`` property; its submit() is thread-safe.
+        _ = self.client
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # map() yields results in input order.
+            return list(executor.map(self._delete_document_safely, paper_ids))
+
+    def _delete_document_safely(self, paper_id: str) -> dict[str, Any]:
+        try:
+            return self.delete_document(paper_id)
+        except Exception as e:
+            logger.error("Failed to delete document '%s': %s", paper_id, e)
+            return {"status": "error", "paper_id": paper_id, "error": str(e)}
 
     def _find_paper_ids_in_range(self, start_date: str, end_date: str) -> list[str]:
         """Return paper_ids whose base_date falls in [start_date, end_date].
@@ -376,10 +414,8 @@ class NeptuneClient:
         base_date property that predicate makes Neptune full-scan + materialize
         and blow MemoryLimitExceededException. __Source__ is one-per-paper (tiny).
         valueMap streams one small map per source (no fold/project/closures).
+        Callers validate the dates.
         """
-        if not (_is_valid_date_format(start_date) and _is_valid_date_format(end_date)):
-            raise ValueError("Date values must be in 'YYYY-MM-DD' format.")
-
         try:
             id_rows = self._submit_query(
                 f"g.V().hasLabel('{Vertex.SOURCE.value}')"
@@ -412,7 +448,7 @@ class NeptuneClient:
 
     def delete_documents_by_date(self, base_date: str) -> dict[str, Any]:
         """Delete every paper whose base_date is exactly ``base_date``."""
-        if not _is_valid_date_format(base_date):
+        if not is_iso_date(base_date):
             raise ValueError("'base_date' must be in the format 'YYYY-MM-DD'.")
 
         paper_ids = self._find_paper_ids_in_range(base_date, base_date)
@@ -427,6 +463,9 @@ class NeptuneClient:
         self, start_date: str, end_date: str
     ) -> dict[str, Any]:
         """Delete every paper whose base_date is in [start_date, end_date]."""
+        if not (is_iso_date(start_date) and is_iso_date(end_date)):
+            raise ValueError("Date values must be in 'YYYY-MM-DD' format.")
+
         paper_ids = self._find_paper_ids_in_range(start_date, end_date)
         if not paper_ids:
             return {
@@ -14,26 +14,29 @@ removes every match in one server-side call with no hit cap.
 from __future__ import annotations
 
 import logging
-import re
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
 
-import boto3
 from opensearchpy import NotFoundError, OpenSearch, RequestsHttpConnection
 from requests_aws4auth import AWS4Auth
 
+from .text_utils import is_iso_date
+
+if TYPE_CHECKING:
+    import boto3
+
 # Module logger inherits the handlers/level configured by the importing app.
 logger = logging.getLogger(__name__)
 
-_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
 _PAPER_ID_FIELD = "metadata.source.metadata.paper_id"
 _BASE_DATE_FIELD = "metadata.source.metadata.base_date"
 
 
-def _is_valid_date_format(date_str: str) -> bool:
-    return bool(date_str) and bool(_DATE_RE.match(date_str))
-
-
 class OpenSearchClient:
+    # Per-paper delete_by_query calls are independent and network-bound; the
+    # opensearch-py transport is safe to share across threads.
+    MAX_WORKERS: int = 8
+
     def __init__(
         self,
         host: str,
@@ -41,10 +44,40 @@ class OpenSearchClient:
         index: str,
         boto3_session: boto3.Session,
         region_name: str,
+        client: OpenSearch | None = None,
     ):
         if not all([host, port, index, region_name, boto3_session]):
             raise ValueError("All OpenSearch connection parameters must be provided.")
         self.index = index
+        if client is None:
+            client = self._connect(host, port, boto3_session, region_name)
+        self.client = client
+        logger.info("OpenSearch endpoint: '%s:%s' (index '%s')", host, port, index)
+
+    @classmethod
+    def for_indexes(
+        cls,
+        host: str,
+        port: int,
+        indexes: list[str],
+        boto3_session: boto3.Session,
+        region_name: str,
+    ) -> dict[str, OpenSearchClient]:
+        """Build one client per index over a single shared connection.
+
+        Every index lives on the same collection, so they share one signer,
+        one credential load and one HTTP connection pool.
+        """
+        shared = cls._connect(host, port, boto3_session, region_name)
+        return {
+            index: cls(host, port, index, boto3_session, region_name, client=shared)
+            for index in indexes
+        }
+
+    @classmethod
+    def _connect(
+        cls, host: str, port: int, boto3_session: boto3.Session, region_name: str
+    ) -> OpenSearch:
         try:
             credentials = boto3_session.get_credentials()
             awsauth = AWS4Auth(
@@ -54,23 +87,23 @@ class OpenSearchClient:
                 "aoss",
                 session_token=credentials.token,
             )
-            self.client = OpenSearch(
+            client = OpenSearch(
                 hosts=[{"host": host, "port": port}],
                 http_auth=awsauth,
                 use_ssl=True,
                 verify_certs=True,
                 connection_class=RequestsHttpConnection,
+                # Keep one pooled keep-alive connection per batch-delete worker.
+                pool_maxsize=cls.MAX_WORKERS,
                 timeout=30,
                 retry_on_timeout=True,
                 max_retries=3,
             )
-            logger.info("OpenSearch connection successful for index '%s'", index)
+            logger.info("OpenSearch connection successful for host '%s'", host)
+            return client
         except Exception as e:
-            logger.error(
-                "Failed to initialize OpenSearch client for index '%s': %s", index, e
-            )
+            logger.error("Failed to initialize OpenSearch client for '%s': %s", host, e)
             raise
-        logger.info("OpenSearch endpoint: '%s:%s'", host, port)
 
     def _check_index_exists(self) -> bool:
         try:
@@ -88,7 +121,12 @@ class OpenSearchClient:
             return {"status": "skipped", "reason": f"Index '{self.index}' not found."}
 
         try:
-            response = self.client.delete_by_query(index=self.index, body=body)
+            # conflicts="proceed": a version conflict (e.g. a doc rewritten by a
+            # concurrent re-index) is reported in "failures" instead of aborting
+            # the whole delete part-way through.
+            response = self.client.delete_by_query(
+                index=self.index, body=body, conflicts="proceed"
+            )
             logger.info(
                 "OpenSearch deletion for index '%s': deleted=%s total=%s",
                 self.index,
@@ -121,10 +159,22 @@ class OpenSearchClient:
         if not paper_ids:
             logger.warning("No 'paper_id's provided for batch deletion.")
             return []
-        return [self.delete_document(paper_id) for paper_id in paper_ids]
+        max_workers = min(self.MAX_WORKERS, len(paper_ids))
+        if max_workers <= 1:
+            return [self._delete_document_safely(p) for p in paper_ids]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # map() yields results in input order.
+            return list(executor.map(self._delete_document_safely, paper_ids))
+
+    def _delete_document_safely(self, paper_id: str) -> dict[str, Any]:
+        try:
+            return self.delete_document(paper_id)
+        except Exception as e:
+            logger.error("Failed to delete document '%s': %s", paper_id, e)
+            return {"status": "error", "paper_id": paper_id, "error": str(e)}
 
     def delete_documents_by_date(self, base_date: str) -> dict[str, Any]:
-        if not _is_valid_date_format(base_date):
+        if not is_iso_date(base_date):
             raise ValueError("'base_date' must be in the format 'YYYY-MM-DD'.")
         body = {"query": {"term": {_BASE_DATE_FIELD: base_date}}}
         return self._delete_by_query(body, base_date=base_date)
@@ -132,7 +182,7 @@ class OpenSearchClient:
     def delete_documents_by_date_range(
         self, start_date: str, end_date: str
     ) -> dict[str, Any]:
-        if not (_is_valid_date_format(start_date) and _is_valid_date_format(end_date)):
+        if not (is_iso_date(start_date) and is_iso_date(end_date)):
             raise ValueError("Date values must be in 'YYYY-MM-DD' format.")
         body = {
             "query": {"range": {_BASE_DATE_FIELD: {"gte": start_date, "lte": end_date}}}
@@ -28,6 +28,7 @@ dependency on the heavy fetcher modules and is trivially unit-testable.
 
 from __future__ import annotations
 
+import heapq
 import math
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
@@ -83,6 +84,11 @@ class ScoredPaper:
     recency: float
 
 
+def _rank_key(scored: ScoredPaper) -> tuple[float, int, str]:
+    """Best score first; ties broken by more upvotes, then title."""
+    return (-scored.score, -scored.paper.upvotes, scored.paper.title)
+
+
 @dataclass
 class PaperScorer:
     """Rank papers by a configurable popularity + recency score.
@@ -121,8 +127,9 @@ class PaperScorer:
 
         ref = reference_date or datetime.now(UTC)
         scored = self._score_all(eligible, ref)
-        scored.sort(key=lambda s: (-s.score, -s.paper.upvotes, s.paper.title))
-        return [s.paper for s in scored[:limit]]  # type: ignore[misc]
+        # Same result as sorting then slicing, in O(n log limit).
+        top = heapq.nsmallest(limit, scored, key=_rank_key)
+        return [s.paper for s in top]  # type: ignore[misc]
 
     def score_all(
         self, papers: list[P], reference_date: datetime | None = None
@@ -136,7 +143,7 @@ class PaperScorer:
         eligible = [p for p in deduped if self._meets_floor(p.upvotes)]
         ref = reference_date or datetime.now(UTC)
         scored = self._score_all(eligible, ref)
-        scored.sort(key=lambda s: (-s.score, -s.paper.upvotes, s.paper.title))
+        scored.sort(key=_rank_key)
         return scored
 
     def _meets_floor(self, upvotes: int) -> bool:
@@ -0,0 +1,72 @@
+"""Shared SSM Parameter Store helpers.
+
+Single implementation of the cached ``GetParameter`` and batched
+``GetParameters`` lookups used by the cleaner and the indexer (previously
+near-identical copies in their ``aws_helpers.py``).
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from botocore.exceptions import ClientError
+
+if TYPE_CHECKING:
+    import boto3
+
+# Module logger inherits the handlers/level configured by the importing app.
+logger = logging.getLogger(__name__)
+
+# GetParameters accepts at most this many names per request.
+_SSM_GET_PARAMETERS_MAX_NAMES = 10
+
+# Endpoint and job parameters are static for the life of a process (or a Lambda
+# container), so each is fetched at most once; repeat lookups skip the SSM
+# round-trip entirely.
+_SSM_CACHE: dict[str, str] = {}
+
+
+def get_ssm_param_value(boto3_session: boto3.Session, param_name: str) -> str:
+    cached = _SSM_CACHE.get(param_name)
+    if cached is not None:
+        return cached
+
+    ssm_client = boto3_session.client("ssm")
+    try:
+        response = ssm_client.get_parameter(Name=param_name, WithDecryption=True)
+        value = response["Parameter"]["Value"]
+        _SSM_CACHE[param_name] = value
+        return value
+    except ClientError as error:
+        logger.error("Failed to get SSM parameter '%s': %s", param_name, error)
+        raise error
+
+
+def get_ssm_param_values(
+    boto3_session: boto3.Session, param_names: list[str]
+) -> dict[str, str]:
+    """Fetch several parameters with as few GetParameters round-trips as possible.
+
+    Values already fetched in this process are served from the cache; only the
+    misses are requested, 10 names per call. The result is keyed by name in the
+    order of ``param_names``. Raises ``ValueError`` if any parameter does not
+    exist.
+    """
+    missing = [name for name in dict.fromkeys(param_names) if name not in _SSM_CACHE]
+    if missing:
+        ssm_client = boto3_session.client("ssm")
+        invalid: list[str] = []
+        for start in range(0, len(missing), _SSM_GET_PARAMETERS_MAX_NAMES):
+            names = missing[start : start + _SSM_GET_PARAMETERS_MAX_NAMES]
+            try:
+                response = ssm_client.get_parameters(Names=names, WithDecryption=True)
+            except ClientError as error:
+                logger.error("Failed to get SSM parameters %s: %s", names, error)
+                raise
+            for parameter in response["Parameters"]:
+                _SSM_CACHE[parameter["Name"]] = parameter["Value"]
+            invalid.extend(response.get("InvalidParameters", []))
+        if invalid:
+            raise ValueError(f"SSM parameters not found: {invalid}")
+    return {name: _SSM_CACHE[name] for name in param_names}
@@ -1,7 +1,8 @@
-"""Shared text helpers used across output handlers.
+"""Shared text helpers used across output handlers and the storage clients.
 
 These were previously duplicated (and had drifted) between the Slack and GitHub
-output handlers. Centralizing them here keeps a single, tested implementation.
+output handlers, and between the Neptune and OpenSearch clients. Centralizing
+them here keeps a single, tested implementation.
 """
 
 from __future__ import annotations
@@ -9,6 +10,12 @@ from __future__ import annotations
 import re
 
 _MARKDOWN_LINK = re.compile(r"\[([^]]+)]\(([^)]+)\)")
+_ISO_DATE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+def is_iso_date(value: str) -> bool:
+    """Return whether ``value`` is shaped like a ``YYYY-MM-DD`` date."""
+    return bool(value) and _ISO_DATE.fullmatch(value) is not None
 
 
 def convert_markdown_to_slack_links(text: str) -> str:
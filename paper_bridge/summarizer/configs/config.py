@@ -4,9 +4,9 @@ from typing import Literal
 
 import yaml
 from dotenv import load_dotenv
-from pydantic import Field, FilePath
+from pydantic import BaseModel, Field, FilePath
 
-from paper_bridge.shared import BaseModelWithDefaults, EnvVars, Format, LanguageModelId
+from paper_bridge.shared import EnvVars, Format, LanguageModelId, drop_none
 
 
 class LocalPaths(str, Enum):
@@ -21,19 +21,19 @@ class LocalPaths(str, Enum):
 
 
 # Trigger configuration
-class AutoMode(BaseModelWithDefaults):
+class AutoMode(BaseModel):
     enabled: bool = Field(default=True)
     source: Literal["huggingface_daily_papers"] = Field(
         default="huggingface_daily_papers"
     )
 
 
-class TriggerConfig(BaseModelWithDefaults):
+class TriggerConfig(BaseModel):
     auto_mode: AutoMode = Field(default_factory=AutoMode)
 
 
 # Input configuration
-class InputConfig(BaseModelWithDefaults):
+class InputConfig(BaseModel):
     pdf_download_timeout: int = Field(default=120, ge=10)
     temp_dir_base: str = Field(default="/tmp/paper-bridge")
     use_md5_hash_dirs: bool = Field(default=True)
@@ -41,13 +41,13 @@ class InputConfig(BaseModelWithDefaults):
 
 
 # Output configuration
-class SlackOutput(BaseModelWithDefaults):
+class SlackOutput(BaseModel):
     enabled: bool = Field(default=True)
     html_template: str = Field(default="template.html")
     apply_retrieval: bool = Field(default=True)
 
 
-class GithubOutput(BaseModelWithDefaults):
+class GithubOutput(BaseModel):
     enabled: bool = Field(default=False)
     repo_name: str | None = Field(default=None)
     base_branch: str = Field(default="main")
@@ -58,13 +58,13 @@ class GithubOutput(BaseModelWithDefaults):
     assets_dir: str = Field(default="assets")
 
 
-class OutputConfig(BaseModelWithDefaults):
+class OutputConfig(BaseModel):
     mode: Literal["slack", "github"] = Field(default="slack")
     slack: SlackOutput = Field(default_factory=SlackOutput)
     github: GithubOutput = Field(default_factory=GithubOutput)
 
 
-class Resources(BaseModelWithDefaults):
+class Resources(BaseModel):
     project_name: str = Field(min_length=1)
     stage: Literal["dev", "prod"] = Field(default="dev")
     default_region_name: str = Field(default="us-west-2")
@@ -78,7 +78,7 @@ class Resources(BaseModelWithDefaults):
     s3_outputs_path: str = Field(default="outputs")
 
 
-class Summarization(BaseModelWithDefaults):
+class Summarization(BaseModel):
     papers_per_day: int = Field(default=5, ge=1)
     days_to_fetch: int = Field(default=7, ge=1)
     min_upvotes: int | None = Field(default=None, ge=0)
@@ -94,7 +94,7 @@ class Summarization(BaseModelWithDefaults):
     enable_prompt_caching: bool = Field(default=True)
 
 
-class Retrieval(BaseModelWithDefaults):
+class Retrieval(BaseModel):
     output_format: Format | None = Field(default=None)
     traversal_based_or_semantic_guided: Literal[
         "traversal_based", "semantic_guided"
@@ -111,7 +111,7 @@ class Retrieval(BaseModelWithDefaults):
     enable_prompt_caching: bool = Field(default=True)
 
 
-class Config(BaseModelWithDefaults):
+class Config(BaseModel):
     resources: Resources = Field(
         default_factory=lambda: Resources(project_name="paper-bridge")
     )
@@ -126,7 +126,7 @@ class Config(BaseModelWithDefaults):
         try:
             with open(file_path, encoding="utf-8") as file:
                 config_data = yaml.safe_load(file) or {}
-            return cls(**config_data)
+            return cls(**drop_none(config_data))
         except (OSError, yaml.YAMLError) as e:
             raise ValueError(f"Failed to load config from {file_path}: {str(e)}") from e
 
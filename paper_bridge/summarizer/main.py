@@ -6,6 +6,7 @@ from pprint import pformat
 
 import boto3
 
+from paper_bridge.shared import is_iso_date
 from paper_bridge.summarizer.configs import Config
 from paper_bridge.summarizer.src import (
     NULL_STRING,
@@ -50,7 +51,9 @@ def parse_target_date(date_str: str | None) -> datetime | None:
     if not date_str or date_str.lower() == NULL_STRING:
         return None
     try:
-        return datetime.strptime(date_str, "%Y-%m-%d")
+        if not is_iso_date(date_str):
+            raise ValueError(f"'{date_str}' does not match 'YYYY-MM-DD'")
+        return datetime.fromisoformat(date_str)
     except ValueError as e:
         logger.error("Invalid date format: %s", e)
         raise DateFormatError(f"Invalid date format: {e}") from e
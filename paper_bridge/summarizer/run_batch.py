@@ -1,12 +1,10 @@
 import argparse
 import sys
 from datetime import UTC, datetime
-from pathlib import Path
 from typing import Any
 
 import boto3
 
-sys.path.append(str(Path(__file__).parent.parent.parent))
 from paper_bridge.summarizer.configs import Config
 from paper_bridge.summarizer.src import (
     NULL_STRING,
@@ -1,40 +1,46 @@
+import functools
 import os
 import time
 from pathlib import Path
+from typing import Any
 
 import boto3
 from boto3.exceptions import S3UploadFailedError
 from boto3.s3.transfer import TransferConfig
+from botocore.config import Config as BotocoreConfig
 from botocore.exceptions import ClientError
 
-from .logger import logger
+# Re-exported so existing ``from .aws_helpers import ...`` imports keep working.
+from paper_bridge.shared.bedrock import get_cross_inference_model_id
 
+from .logger import logger
 
-def get_cross_inference_model_id(
-    boto3_session: boto3.Session, model_id: str, region_name: str
-) -> str:
-    if not all([boto3_session, model_id, region_name]):
-        raise ValueError("All parameters must be provided")
+__all__ = [
+    "get_cross_inference_model_id",
+    "get_ssm_param_value",
+    "submit_batch_job",
+    "upload_dir_to_s3",
+    "upload_to_s3",
+    "wait_for_batch_job_completion",
+]
 
-    prefix = "apac" if region_name.startswith("ap-") else region_name[:2]
-    cr_model_id = f"{prefix}.{model_id}"
 
-    try:
-        bedrock_client = boto3_session.client("bedrock", region_name=region_name)
-        response = bedrock_client.list_inference_profiles(
-            maxResults=1000, typeEquals="SYSTEM_DEFINED"
-        )
-        profile_list = [
-            p["inferenceProfileId"] for p in response["inferenceProfileSummaries"]
-        ]
+_S3_MAX_CONCURRENCY: int = 10
 
-        if cr_model_id in profile_list:
-            return cr_model_id
 
-    except Exception as e:
-        logger.error("Error checking cross-inference support: %s", str(e))
+@functools.lru_cache(maxsize=8)
+def _s3_client(boto3_session: boto3.Session) -> Any:
+    """Return one S3 client per session so its connection pool is reused.
 
-    return model_id
+    The output handlers upload every rendered page with a separate call; building
+    a fresh client each time re-loads the service model and starts a cold pool.
+    """
+    return boto3_session.client(
+        "s3",
+        config=BotocoreConfig(
+            max_pool_connections=_S3_MAX_CONCURRENCY, tcp_keepalive=True
+        ),
+    )
 
 
 def get_ssm_param_value(boto3_session: boto3.Session, param_name: str) -> str | None:
@@ -88,13 +94,15 @@ def upload_dir_to_s3(
     public_readable: bool = False,
 ) -> int:
     try:
-        s3_client = boto3_session.client("s3")
+        s3_client = _s3_client(boto3_session)
         file_ext_to_incl = file_ext_to_incl or []
 
+        # Papers, figures and reports are well below this, so each goes up in a
+        # single PUT instead of a create/upload-part/complete multipart round.
         config = TransferConfig(
-            multipart_threshold=1024 * 25,
-            max_concurrency=10,
-            multipart_chunksize=1024 * 25,
+            multipart_threshold=1024 * 1024 * 25,
+            max_concurrency=_S3_MAX_CONCURRENCY,
+            multipart_chunksize=1024 * 1024 * 25,
             use_threads=True,
         )
 
@@ -146,7 +154,7 @@ def upload_to_s3(
         return False
 
     try:
-        s3_client = boto3_session.client("s3")
+        s3_client = _s3_client(boto3_session)
 
         prefix = s3_prefix.strip("/") + "/" if s3_prefix else ""
         s3_key = f"{prefix}{file_path.name}"
@@ -4,7 +4,6 @@ import asyncio
 import base64
 import json
 import re
-import time
 from collections.abc import Sequence
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import UTC, datetime, timedelta
@@ -20,6 +19,8 @@ from bs4 import BeautifulSoup, Tag
 from llama_index.core.llms import ChatMessage, ImageBlock, MessageRole, TextBlock
 from llama_index.core.prompts import ChatPromptTemplate
 from pydantic import BaseModel, Field, HttpUrl, field_validator
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 from paper_bridge.shared import PaperScorer, SelectionConfig
 from paper_bridge.shared.arxiv_client import download_pdf as download_arxiv_pdf
@@ -562,6 +563,7 @@ class PaperFetcher:
     DEFAULT_TIMEOUT: int = 60
     MAX_RETRIES: int = 3
     RETRY_DELAY: int = 1
+    MAX_RETRY_DELAY: int = 30
     MAX_WORKERS: int = 4
     MIN_PAPERS_PER_DAY: int = 1
     MIN_DAYS_TO_FETCH: int = 1
@@ -594,6 +596,7 @@ class PaperFetcher:
             else None
         )
         self.timeout = max(1, timeout)
+        self._http = self._create_http_session()
         self._scorer = PaperScorer(
             SelectionConfig(
                 popularity_weight=config.summarization.selection_popularity_weight,
@@ -654,6 +657,10 @@ class PaperFetcher:
     @staticmethod
     def _fetch_papers_by_arxiv_ids(arxiv_ids: list[str]) -> list[Paper]:
         logger.info("Fetching papers by arXiv IDs: '%s'", arxiv_ids)
+        # Drop repeated ids (order-preserving) so each paper is downloaded and
+        # parsed once; the date-range path already de-duplicates in
+        # _select_papers.
+        arxiv_ids = list(dict.fromkeys(arxiv_ids))
         # ONE batched, serialized API call for all ids (see shared.arxiv_client),
         # instead of a per-id loop that triggered 429s.
         metadata = fetch_arxiv_metadata(arxiv_ids)
@@ -757,11 +764,16 @@ class PaperFetcher:
         start_date = end_date - timedelta(days=days - 1)
         logger.info("Fetching papers from '%s' to '%s'", start_date, end_date)
 
-        for current_date in self._date_range(start_date, end_date):
-            date_str = current_date.strftime("%Y-%m-%d")
-            papers = self._fetch_daily_papers(date_str, current_date)
-            if papers:
-                papers_by_date[current_date.date().isoformat()] = papers
+        # One independent HF API call per day; map() keeps the results in date order.
+        dates = self._date_range(start_date, end_date)
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            daily_papers = executor.map(
+                lambda day: self._fetch_daily_papers(day.strftime("%Y-%m-%d"), day),
+                dates,
+            )
+            for current_date, papers in zip(dates, daily_papers, strict=True):
+                if papers:
+                    papers_by_date[current_date.date().isoformat()] = papers
 
         return papers_by_date
 
@@ -779,29 +791,44 @@ class PaperFetcher:
 
         papers = []
         for paper_data in response.json():
-            if paper := self._process_paper_metadata(paper_data, current_date):
+            if paper := self._process_paper_metadata(
+                paper_data, current_date, date_str
+            ):
                 papers.append(paper)
         return papers
 
+    def _create_http_session(self) -> requests.Session:
+        # Shared keep-alive pool for the per-day HF API calls. urllib3 retries
+        # connection errors and 429/5xx with jittered exponential backoff, honoring
+        # Retry-After; other 4xx fail fast.
+        retry = Retry(
+            total=self.MAX_RETRIES - 1,
+            backoff_factor=self.RETRY_DELAY,
+            backoff_jitter=self.RETRY_DELAY / 2,
+            backoff_max=self.MAX_RETRY_DELAY,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset({"GET"}),
+            raise_on_status=False,
+        )
+        session = requests.Session()
+        session.mount(
+            "https://", HTTPAdapter(max_retries=retry, pool_maxsize=self.MAX_WORKERS)
+        )
+        return session
+
     def _make_request(self, url: str) -> requests.Response | None:
-        for attempt in range(self.MAX_RETRIES):
-            try:
-                response = requests.get(url, timeout=self.timeout)
-                response.raise_for_status()
-                return response
-            except requests.RequestException as e:
-                if attempt == self.MAX_RETRIES - 1:
-                    logger.error(
-                        "Failed to fetch data after %d attempts: %s",
-                        self.MAX_RETRIES,
-                        str(e),
-                    )
-                    return None
-                time.sleep(self.RETRY_DELAY * (2**attempt))
-        return None
+        try:
+            response = self._http.get(url, timeout=self.timeout)
+            response.raise_for_status()
+            return response
+        except requests.RequestException as e:
+            logger.error(
+                "Failed to fetch data after %d attempts: %s", self.MAX_RETRIES, str(e)
+            )
+            return None
 
     def _process_paper_metadata(
-        self, paper_data: dict[str, Any], current_date: datetime
+        self, paper_data: dict[str, Any], current_date: datetime, base_date: str
     ) -> Paper | None:
         try:
             published_at = self._parse_date(paper_data.get("publishedAt"))
@@ -817,7 +844,7 @@ class PaperFetcher:
                 upvotes=paper_info.get("upvotes", 0),
                 thumbnail=paper_info.get("thumbnail"),
                 pdf_url=HttpUrl(f"{URLs.ARXIV_PDF.url}/{paper_info['id']}"),
-                base_date=current_date.strftime("%Y-%m-%d"),
+                base_date=base_date,
             )
             if self._meets_upvote_threshold(paper.upvotes):
                 return paper
@@ -831,7 +858,8 @@ class PaperFetcher:
         if not date_str:
             return None
         try:
-            return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+            # Python 3.11+ parses the trailing "Z" (UTC) natively.
+            return datetime.fromisoformat(date_str)
         except ValueError:
             logger.error("Invalid date format: %s", date_str)
             return None
@@ -393,11 +393,10 @@ def send_failure_notification(
 ) -> None:
     sns = boto3_session.client("sns")
     date_str = get_formatted_date(target_date)
-    paper_ids = [paper.arxiv_id for paper in papers]
 
     fields = {"Date": date_str}
-    if paper_ids:
-        fields["Paper IDs"] = ", ".join(paper_ids)
+    if papers:
+        fields["Paper IDs"] = ", ".join(paper.arxiv_id for paper in papers)
     fields["Error"] = error_message or "Unknown error"
 
     subject, message = format_alarm(event="Summarizer", status="FAILED", fields=fields)
@@ -408,9 +407,4 @@ def get_formatted_date(target_date: datetime | None) -> str:
     if target_date:
         return target_date.strftime("%Y-%m-%d")
 
-    return (
-        datetime.now(UTC)
-        .replace(hour=0, minute=0, second=0, microsecond=0)
-        .astimezone(UTC)
-        - timedelta(days=1)
-    ).strftime("%Y-%m-%d")
+    return (datetime.now(UTC).date() - timedelta(days=1)).isoformat()
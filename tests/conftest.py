@@ -15,12 +15,15 @@ import pytest
 
 
 @pytest.fixture(autouse=True)
-def _clean_aws_env(monkeypatch: pytest.MonkeyPatch) -> None:
+def _clean_aws_env(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
     """Ensure tests never accidentally look like they run inside AWS.
 
-    ``is_aws_env()`` keys off a set of AWS-injected env vars; clearing them makes
-    environment detection deterministic regardless of where the suite runs.
+    ``is_aws_env()`` keys off a set of AWS-injected env vars; clearing them (and
+    its cached answer) makes environment detection deterministic regardless of
+    where the suite runs.
     """
+    from paper_bridge.shared.logger import is_aws_env
+
     for var in (
         "AWS_BATCH_JOB_ID",
         "AWS_ECS_CONTAINER_METADATA_URI",
@@ -31,6 +34,21 @@ def _clean_aws_env(monkeypatch: pytest.MonkeyPatch) -> None:
         "ECS_CONTAINER_METADATA_URI",
     ):
         monkeypatch.delenv(var, raising=False)
+    is_aws_env.cache_clear()
+    yield
+    is_aws_env.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def _empty_ssm_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Start every test with an empty process-wide SSM parameter cache.
+
+    ``paper_bridge.shared.ssm`` memoizes looked-up values for the life of the
+    process, so without this a value stubbed in one test would leak into the next.
+    """
+    from paper_bridge.shared import ssm
+
+    monkeypatch.setattr(ssm, "_SSM_CACHE", {})
 
 
 @pytest.fixture
@@ -1,55 +1,87 @@
-"""Tests for ``paper_bridge.shared.base_models.BaseModelWithDefaults``.
+"""Tests for ``paper_bridge.shared.base_models``.
 
-The model's ``before`` validator swaps explicit ``None`` for the field default so
-YAML-loaded configs (where missing keys deserialize to None) still validate.
+YAML-loaded configs render valueless keys as ``None``; ``drop_none`` strips them
+before validation (``none_to_default`` does the same per field) so the field
+defaults apply. ``yaml_loader`` picks the loader both app configs parse with.
 """
 
 import pytest
-from pydantic import Field
+from pydantic import BaseModel, Field, field_validator
 
-from paper_bridge.shared.base_models import BaseModelWithDefaults
+from paper_bridge.shared.base_models import drop_none, none_to_default, yaml_loader
 
 
-class _Sample(BaseModelWithDefaults):
+class _Sample(BaseModel):
     name: str = Field(default="anon")
     count: int = Field(default=3)
     note: str | None = Field(default=None)
 
 
 @pytest.mark.unit
-class TestBaseModelWithDefaults:
-    def test_none_replaced_with_default(self) -> None:
-        m = _Sample(name=None, count=None)
+class TestDropNone:
+    def test_none_keys_fall_back_to_defaults(self) -> None:
+        m = _Sample(**drop_none({"name": None, "count": None}))
         assert m.name == "anon"
         assert m.count == 3
 
     def test_real_value_kept(self) -> None:
-        m = _Sample(name="real", count=10)
-        assert m.name == "real"
-        assert m.count == 10
+        assert drop_none({"name": "real", "count": 10}) == {"name": "real", "count": 10}
 
     def test_zero_and_empty_string_kept(self) -> None:
         # Only None is special; falsy-but-not-None values pass through.
-        m = _Sample(name="", count=0)
-        assert m.name == ""
-        assert m.count == 0
-
-    def test_none_with_none_default_stays_none(self) -> None:
-        # When the field default IS None, the validator leaves the None in place.
-        m = _Sample(note=None)
-        assert m.note is None
-
-    def test_missing_fields_use_defaults(self) -> None:
-        m = _Sample()
-        assert (m.name, m.count, m.note) == ("anon", 3, None)
-
-    def test_non_dict_input_passthrough(self) -> None:
-        # The validator returns non-dict input untouched (it then fails normal
-        # pydantic validation since a string isn't a valid model payload).
+        assert drop_none({"name": "", "count": 0}) == {"name": "", "count": 0}
+
+    def test_nested_sections(self) -> None:
+        data = {"a": {"b": None, "c": 1}, "empty": None, "items": [{"x": None}, None]}
+        assert drop_none(data) == {"a": {"c": 1}, "items": [{}, None]}
+
+    def test_input_not_mutated(self) -> None:
+        data = {"name": None, "nested": {"count": None}}
+        drop_none(data)
+        assert data == {"name": None, "nested": {"count": None}}
+
+    def test_explicit_none_no_longer_defaulted_by_model(self) -> None:
+        # The per-instance before-validator is gone; loaders call drop_none.
         with pytest.raises(Exception):
-            _Sample.model_validate("not a dict")
+            _Sample(count=None)
+
 
-    def test_partial_override(self) -> None:
-        m = _Sample(name=None, count=99)
+class _Native(BaseModel):
+    name: str = Field(default="anon")
+    tags: list[str] = Field(default_factory=lambda: ["a"])
+    required: int
+
+    _none_to_default = field_validator("*", mode="before")(none_to_default)
+
+
+@pytest.mark.unit
+class TestNoneToDefault:
+    def test_none_replaced_with_default(self) -> None:
+        m = _Native(name=None, required=1)
         assert m.name == "anon"
-        assert m.count == 99
+
+    def test_none_uses_default_factory(self) -> None:
+        a = _Native(tags=None, required=1)
+        b = _Native(tags=None, required=1)
+        assert a.tags == ["a"]
+        assert a.tags is not b.tags
+
+    def test_required_field_none_still_fails(self) -> None:
+        with pytest.raises(Exception):
+            _Native(required=None)
+
+    def test_input_not_mutated(self) -> None:
+        data = {"name": None, "required": 1}
+        _Native.model_validate(data)
+        assert data == {"name": None, "required": 1}
+
+
+@pytest.mark.unit
+class TestYamlLoader:
+    def test_uses_libyaml_loader_when_available(self) -> None:
+        import yaml
+
+        if yaml.__with_libyaml__:
+            assert yaml_loader() is yaml.CSafeLoader
+        else:
+            assert yaml_loader() is yaml.SafeLoader
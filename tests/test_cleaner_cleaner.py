@@ -0,0 +1,69 @@
+"""Tests for ``paper_bridge.cleaner.src.cleaner.Cleaner``.
+
+The Neptune / OpenSearch clients are ``MagicMock``s, so no AWS is touched.
+"""
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from paper_bridge.cleaner.src.cleaner import Cleaner
+
+
+def _cleaner(neptune: MagicMock, opensearch: dict[str, MagicMock]) -> Cleaner:
+    cleaner = Cleaner.__new__(Cleaner)  # skip __init__/AWS auth
+    cleaner.neptune_client = neptune
+    cleaner.opensearch_clients = opensearch
+    return cleaner
+
+
+@pytest.mark.unit
+class TestDeleteDocumentsByDateRange:
+    def test_backends_run_concurrently(self) -> None:
+        # Every backend blocks until all three have started; run sequentially,
+        # the barrier would time out.
+        barrier = threading.Barrier(3, timeout=5)
+
+        def delete(start: str, end: str) -> dict:
+            barrier.wait()
+            return {"status": "success"}
+
+        neptune = MagicMock()
+        neptune.delete_documents_by_date_range.side_effect = delete
+        indexes = {name: MagicMock() for name in ("chunk", "statement")}
+        for client in indexes.values():
+            client.delete_documents_by_date_range.side_effect = delete
+
+        result = _cleaner(neptune, indexes).delete_documents_by_date_range(
+            "2026-01-01", "2026-01-07"
+        )
+
+        assert result["neptune"] == {"status": "success"}
+        assert list(result["opensearch"]) == ["chunk", "statement"]
+
+    def test_opensearch_error_is_reported_per_index(self) -> None:
+        neptune = MagicMock()
+        neptune.delete_documents_by_date_range.return_value = {"status": "completed"}
+        ok, bad = MagicMock(), MagicMock()
+        ok.delete_documents_by_date_range.return_value = {"status": "success"}
+        bad.delete_documents_by_date_range.side_effect = RuntimeError("boom")
+
+        result = _cleaner(
+            neptune, {"chunk": bad, "statement": ok}
+        ).delete_documents_by_date_range("2026-01-01", "2026-01-07")
+
+        assert result["opensearch"]["statement"] == {"status": "success"}
+        assert result["opensearch"]["chunk"]["status"] == "error"
+        assert "boom" in result["opensearch"]["chunk"]["error"]
+
+    def test_neptune_error_propagates(self) -> None:
+        neptune = MagicMock()
+        neptune.delete_documents_by_date_range.side_effect = RuntimeError("neptune")
+        index = MagicMock()
+        index.delete_documents_by_date_range.return_value = {"status": "success"}
+
+        with pytest.raises(RuntimeError, match="neptune"):
+            _cleaner(neptune, {"chunk": index}).delete_documents_by_date_range(
+                "2026-01-01", "2026-01-07"
+            )
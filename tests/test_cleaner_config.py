@@ -4,6 +4,7 @@ import textwrap
 from pathlib import Path
 
 import pytest
+from pydantic import ValidationError
 
 from paper_bridge.cleaner.configs.config import Cleaner, Config, Resources
 
@@ -16,6 +17,42 @@ class TestDefaults:
         assert cfg.cleaner.days_back >= 1
         assert cfg.cleaner.days_range >= 1
 
+    def test_load_is_cached(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from paper_bridge.cleaner.configs import config as config_module
+
+        monkeypatch.setattr(config_module, "_CONFIG_CACHE", None)
+        assert Config.load() is Config.load()
+
+    def test_load_reparses_when_mtime_changes(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from paper_bridge.cleaner.configs import config as config_module
+
+        stale = Config(resources=Resources(project_name="stale"))
+        key = (config_module.CONFIG_PATH, -1.0)
+        monkeypatch.setattr(config_module, "_CONFIG_CACHE", (key, stale))
+        assert Config.load() is not stale
+
+    def test_load_reads_shipped_config_yaml(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from paper_bridge.cleaner.configs import config as config_module
+
+        monkeypatch.setattr(config_module, "_CONFIG_CACHE", None)
+        shipped = Config.from_yaml(config_module.CONFIG_PATH)
+        assert Config.load() == shipped
+
+    def test_shipped_config_deletion_window(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # The deletion window is destructive; pin what the deployed cleaner loads.
+        from paper_bridge.cleaner.configs import config as config_module
+
+        monkeypatch.setattr(config_module, "_CONFIG_CACHE", None)
+        cfg = Config.load()
+        assert cfg.cleaner.days_back == 365
+        assert cfg.cleaner.days_range == 7
+
     def test_cleaner_defaults(self) -> None:
         c = Cleaner()
         assert c.days_back == 365
@@ -34,6 +71,14 @@ class TestDefaults:
         a.opensearch_indexes.append("extra")
         assert b.opensearch_indexes == ["chunk", "statement"]
 
+    def test_config_is_frozen(self) -> None:
+        # Config.load() shares one instance across warm invocations.
+        config = Config()
+        with pytest.raises(ValidationError):
+            config.cleaner = Cleaner(days_back=1)
+        with pytest.raises(ValidationError):
+            config.cleaner.days_back = 1
+
 
 @pytest.mark.unit
 class TestValidation:
@@ -109,3 +154,114 @@ class TestFromYaml:
         cfg = Config.from_yaml(path)
         assert cfg.cleaner.days_back == 365  # None → default
         assert cfg.cleaner.days_range == 4
+
+    def test_from_json_roundtrip(self, tmp_path: Path) -> None:
+        path = tmp_path / "config.json"
+        path.write_text(
+            '{"resources": {"project_name": "j"}, "cleaner": {"days_back": 3}}',
+            encoding="utf-8",
+        )
+        cfg = Config.from_json(path)
+        assert cfg.resources.project_name == "j"
+        assert cfg.cleaner.days_back == 3
+
+    def test_from_json_malformed_raises_value_error(self, tmp_path: Path) -> None:
+        path = tmp_path / "bad.json"
+        path.write_text("{", encoding="utf-8")
+        with pytest.raises(ValueError):
+            Config.from_json(path)
+
+    def test_parses_with_shared_yaml_loader(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from paper_bridge.cleaner.configs import config as config_module
+        from paper_bridge.shared import yaml_loader
+
+        calls: list[None] = []
+
+        def spy() -> type:
+            calls.append(None)
+            return yaml_loader()
+
+        monkeypatch.setattr(config_module, "yaml_loader", spy)
+        path = tmp_path / "empty.yaml"
+        path.write_text("", encoding="utf-8")
+        Config.from_yaml(path)
+        assert calls == [None]
+
+
+@pytest.mark.unit
+class TestSidecar:
+    @pytest.fixture
+    def paths(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> tuple:
+        from paper_bridge.cleaner.configs import config as config_module
+
+        yaml_path = tmp_path / "config.yaml"
+        sidecar_path = tmp_path / "config.json"
+        monkeypatch.setattr(config_module, "CONFIG_PATH", yaml_path)
+        monkeypatch.setattr(config_module, "SIDECAR_PATH", sidecar_path)
+        monkeypatch.setattr(config_module, "_CONFIG_CACHE", None)
+        return yaml_path, sidecar_path
+
+    def test_compile_writes_equivalent_json(self, paths: tuple) -> None:
+        from paper_bridge.cleaner.configs.config import compile_sidecar
+
+        yaml_path, sidecar_path = paths
+        yaml_path.write_text("cleaner:\n  days_range: 9\n", encoding="utf-8")
+        compile_sidecar(yaml_path, sidecar_path)
+        assert Config.from_json(sidecar_path) == Config.from_yaml(yaml_path)
+
+    def test_compile_rejects_invalid_config(self, paths: tuple) -> None:
+        from paper_bridge.cleaner.configs.config import compile_sidecar
+
+        yaml_path, sidecar_path = paths
+        yaml_path.write_text("cleaner:\n  days_range: 0\n", encoding="utf-8")
+        with pytest.raises(Exception):
+            compile_sidecar(yaml_path, sidecar_path)
+        assert not sidecar_path.exists()
+
+    def test_load_prefers_fresh_sidecar(self, paths: tuple) -> None:
+        import os
+
+        yaml_path, sidecar_path = paths
+        yaml_path.write_text("cleaner:\n  days_range: 1\n", encoding="utf-8")
+        sidecar_path.write_text('{"cleaner": {"days_range": 2}}', encoding="utf-8")
+        os.utime(yaml_path, (1, 1))
+        assert Config.load().cleaner.days_range == 2
+
+    def test_load_ignores_stale_sidecar(self, paths: tuple) -> None:
+        import os
+
+        yaml_path, sidecar_path = paths
+        yaml_path.write_text("cleaner:\n  days_range: 1\n", encoding="utf-8")
+        sidecar_path.write_text('{"cleaner": {"days_range": 2}}', encoding="utf-8")
+        os.utime(sidecar_path, (1, 1))
+        assert Config.load().cleaner.days_range == 1
+
+    def test_from_json_still_validates(self, paths: tuple) -> None:
+        _, sidecar_path = paths
+        sidecar_path.write_text('{"cleaner": {"days_back": 0}}', encoding="utf-8")
+        with pytest.raises(ValueError):
+            Config.from_json(sidecar_path)
+
+    def test_sidecar_load_does_not_import_yaml(self, paths: tuple) -> None:
+        import subprocess
+        import sys
+
+        from paper_bridge.cleaner.configs.config import compile_sidecar
+
+        repo_root = Path(__file__).resolve().parent.parent
+        yaml_path, sidecar_path = paths
+        yaml_path.write_text("cleaner:\n  days_range: 3\n", encoding="utf-8")
+        compile_sidecar(yaml_path, sidecar_path)
+        # The child process does not see our monkeypatches; point it at tmp_path.
+        code = (
+            "import sys\n"
+            "from pathlib import Path\n"
+            "from paper_bridge.cleaner.configs import config as m\n"
+            f"m.CONFIG_PATH = Path({str(yaml_path)!r})\n"
+            f"m.SIDECAR_PATH = Path({str(sidecar_path)!r})\n"
+            "assert m.Config.load().cleaner.days_range == 3\n"
+            "assert 'yaml' not in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], cwd=repo_root, check=True)
@@ -8,6 +8,7 @@ exercised, with a lightweight ``SimpleNamespace`` config for the range math.
 
 from datetime import UTC, datetime
 from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -90,12 +91,27 @@ class TestParseTargetDate:
         assert result == datetime(2025, 3, 28, tzinfo=UTC)
 
     @pytest.mark.parametrize(
-        "bad", ["2025/03/28", "28-03-2025", "March 28", "2025-13-01", "notadate"]
+        "bad",
+        [
+            "2025/03/28",
+            "28-03-2025",
+            "March 28",
+            "2025-13-01",
+            "notadate",
+            "2025-3-28",
+            "20250328",
+            "2025-03-28T12:00",
+        ],
     )
     def test_invalid_format_raises(self, bad: str) -> None:
-        with pytest.raises(DateFormatError):
+        with pytest.raises(DateFormatError, match="YYYY-MM-DD"):
             parse_target_date(bad)
 
+    def test_wrong_shape_cause_names_expected_format(self) -> None:
+        with pytest.raises(DateFormatError) as excinfo:
+            parse_target_date("2025/03/28")
+        assert "expected YYYY-MM-DD" in str(excinfo.value.__cause__)
+
 
 @pytest.mark.unit
 class TestCalculateDateRange:
@@ -147,3 +163,114 @@ class TestCalculateDateRange:
         # Both are ISO date strings, start <= end.
         assert start <= end
         assert len(start) == 10 and len(end) == 10
+
+
+@pytest.mark.unit
+class TestSessionReuse:
+    @pytest.fixture
+    def created_sessions(
+        self, monkeypatch: pytest.MonkeyPatch, aws_credentials: None
+    ) -> list[dict[str, object]]:
+        """Swap in a fake ``boto3.Session`` and return the kwargs of each one built."""
+        import boto3
+
+        from paper_bridge.cleaner import main
+
+        created: list[dict[str, object]] = []
+
+        class _FakeSession:
+            def __init__(self, **kwargs: object) -> None:
+                created.append(kwargs)
+
+            def client(self, name: str) -> object:
+                raise RuntimeError("no network in tests")
+
+        monkeypatch.setattr(boto3, "Session", _FakeSession)
+        monkeypatch.setattr(main, "_SESSION", None)
+        return created
+
+    def test_session_built_once_per_container(
+        self, created_sessions: list[dict[str, object]]
+    ) -> None:
+        from paper_bridge.cleaner import main
+
+        first = main._get_session("us-west-2", None)
+        second = main._get_session("us-west-2", None)
+        assert first is second
+        assert len(created_sessions) == 1
+
+    def test_aws_env_session_has_no_profile(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        created_sessions: list[dict[str, object]],
+    ) -> None:
+        from paper_bridge.cleaner import main
+        from paper_bridge.shared.logger import is_aws_env
+
+        monkeypatch.setenv("AWS_LAMBDA_FUNCTION_NAME", "fn")
+        monkeypatch.setenv("AWS_PROFILE_NAME", "local-profile")
+        monkeypatch.setenv("DEFAULT_REGION_NAME", "eu-west-1")
+        is_aws_env.cache_clear()
+
+        main.setup_dependencies()
+        assert created_sessions == [{"region_name": "eu-west-1", "profile_name": None}]
+
+
+@pytest.mark.unit
+class TestFailureNotificationPath:
+    """SNS must only be touched when an invocation fails inside AWS."""
+
+    @pytest.fixture
+    def session(self, monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+        from paper_bridge.cleaner import main
+
+        session = MagicMock()
+        monkeypatch.setattr(main, "_SESSION", session)
+        monkeypatch.setattr(
+            main,
+            "get_ssm_param_values",
+            lambda _session, names: dict.fromkeys(names, "https://x"),
+        )
+        return session
+
+    def _clients_created(self, session: MagicMock) -> list[str]:
+        return [c.args[0] for c in session.client.call_args_list]
+
+    def test_success_never_creates_sns_client(
+        self, monkeypatch: pytest.MonkeyPatch, session: MagicMock
+    ) -> None:
+        from paper_bridge.cleaner import main
+
+        cleaner = MagicMock()
+        cleaner.delete_documents_by_date_range.return_value = {"ok": True}
+        monkeypatch.setattr(main, "Cleaner", lambda *a, **k: cleaner)
+        monkeypatch.setenv("TOPIC_ARN", "arn:aws:sns:us-west-2:1:t")
+
+        result = main.lambda_handler({"TARGET_DATE": "2025-03-28"}, None)
+        assert result["statusCode"] == 200
+        assert "sns" not in self._clients_created(session)
+
+    def test_failure_outside_aws_skips_sns(
+        self, monkeypatch: pytest.MonkeyPatch, session: MagicMock
+    ) -> None:
+        from paper_bridge.cleaner import main
+
+        monkeypatch.setenv("TOPIC_ARN", "arn:aws:sns:us-west-2:1:t")
+        result = main.lambda_handler({"TARGET_DATE": "bad-date"}, None)
+        assert result["statusCode"] == 500
+        assert "sns" not in self._clients_created(session)
+
+    def test_failure_in_aws_publishes_alarm(
+        self, monkeypatch: pytest.MonkeyPatch, session: MagicMock
+    ) -> None:
+        from paper_bridge.cleaner import main
+        from paper_bridge.shared.logger import is_aws_env
+
+        monkeypatch.setenv("AWS_LAMBDA_FUNCTION_NAME", "fn")
+        monkeypatch.setenv("TOPIC_ARN", "arn:aws:sns:us-west-2:1:t")
+        is_aws_env.cache_clear()
+
+        result = main.lambda_handler({"TARGET_DATE": "bad-date"}, None)
+        assert result["statusCode"] == 500
+        assert self._clients_created(session) == ["sns"]
+        session.client.return_value.publish.assert_called_once()
@@ -8,6 +8,7 @@ import textwrap
 from pathlib import Path
 
 import pytest
+from pydantic import ValidationError
 
 from paper_bridge.indexer.configs.config import (
     Config,
@@ -36,6 +37,19 @@ class TestDefaults:
         assert cfg.resources.project_name
         assert isinstance(cfg.indexing.extraction_model_id, LanguageModelId)
 
+    def test_load_is_cached_until_reload(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        first = Config.load()
+        assert Config.load() is first
+
+        monkeypatch.setenv("S3_BUCKET_NAME", "reloaded-bucket")
+        reloaded = Config.reload()
+        assert reloaded is not first
+        assert reloaded.resources.s3_bucket_name == "reloaded-bucket"
+        assert Config.load() is reloaded
+        # Do not leak the env-derived instance into later tests.
+        monkeypatch.undo()
+        Config.reload()
+
     def test_indexing_numeric_defaults(self) -> None:
         idx = _indexing()
         assert idx.papers_per_day == 5
@@ -45,6 +59,12 @@ class TestDefaults:
         assert idx.min_upvotes is None
         assert idx.use_llama_parse is False
 
+    def test_constructed_defaults_are_valid(self) -> None:
+        # The default factories skip validation (model_construct); a default
+        # Config must still be exactly what validating the same data yields.
+        cfg = Config()
+        assert Config.model_validate(cfg.model_dump()) == cfg
+
     def test_resources_defaults(self) -> None:
         r = Resources(project_name="x")
         assert r.stage == "dev"
@@ -137,9 +157,43 @@ class TestFromYaml:
         cfg = Config.from_yaml(path)
         assert cfg.indexing.papers_per_day == 5
 
+    def test_parses_with_shared_yaml_loader(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from paper_bridge.indexer.configs import config as config_module
+        from paper_bridge.shared import yaml_loader
+
+        calls: list[None] = []
+
+        def spy() -> type:
+            calls.append(None)
+            return yaml_loader()
+
+        monkeypatch.setattr(config_module, "yaml_loader", spy)
+        path = tmp_path / "empty.yaml"
+        path.write_text("", encoding="utf-8")
+        Config.from_yaml(path)
+        assert calls == [None]
+
 
 @pytest.mark.unit
 class TestModelHandler:
+    def test_model_info_literals_are_valid(self) -> None:
+        # _MODEL_INFO skips validation (model_construct); validate it here once.
+        from paper_bridge.indexer.configs.config import _MODEL_INFO, ModelInfo
+
+        for info in _MODEL_INFO.values():
+            assert ModelInfo.model_validate(info.model_dump()) == info
+
+    def test_model_info_table_is_read_only(self) -> None:
+        from paper_bridge.indexer.configs.config import _MODEL_INFO
+
+        with pytest.raises(TypeError):
+            _MODEL_INFO[EmbeddingsModelId.COHERE_EMBED_TEXT_V3] = None  # type: ignore[index]
+        info = ModelHandler.get_model_info(EmbeddingsModelId.COHERE_EMBED_TEXT_V3)
+        with pytest.raises(ValidationError):
+            info.max_sequence_length = 1  # type: ignore[union-attr]
+
     def test_get_dimensions_scalar(self) -> None:
         assert (
             ModelHandler.get_dimensions(EmbeddingsModelId.COHERE_EMBED_TEXT_V3) == 1024
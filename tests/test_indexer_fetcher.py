@@ -0,0 +1,85 @@
+"""Tests for the heading-based main-content pre-pass in the indexer fetcher.
+
+``_find_heading_range`` decides, before any LLM call, which slice of a paper is
+indexed, so its boundaries must match MainContentExtractionPrompt: start at the
+introduction, stop before acknowledgments/references/bibliography/appendix.
+"""
+
+import pytest
+
+from paper_bridge.indexer.src.fetcher import _find_heading_range
+
+BODY = "Body text of the paper.\n" * 20
+MIN_LENGTH = 100
+
+
+def _paper(intro: str | None, end: str | None, preamble: str = "") -> str:
+    parts = ["Title\n\nAbstract\nWe study things.\n", preamble]
+    if intro is not None:
+        parts.append(f"{intro}\n")
+    parts.append(BODY)
+    if end is not None:
+        parts.append(f"{end}\n[1] A. Author. A paper. 2024.\n")
+    return "".join(parts)
+
+
+@pytest.mark.unit
+class TestFindHeadingRange:
+    @pytest.mark.parametrize(
+        "intro",
+        [
+            "Introduction",
+            "1 Introduction",
+            "1. Introduction",
+            "## 1 Introduction",
+            "**1 Introduction**",
+            "I. INTRODUCTION",
+            "INTRODUCTION",
+        ],
+    )
+    @pytest.mark.parametrize(
+        "end",
+        [
+            "References",
+            "# References",
+            "REFERENCES",
+            "7 Bibliography",
+            "Acknowledgments",
+            "ACKNOWLEDGEMENTS",
+            "Appendix A",
+            "Appendices",
+        ],
+    )
+    def test_bounds_body_between_headings(self, intro: str, end: str) -> None:
+        text = _paper(intro, end)
+        content_range = _find_heading_range(text, MIN_LENGTH)
+        assert content_range is not None
+        start, stop = content_range
+        assert text[start:stop].strip().endswith(BODY.strip())
+        assert intro in text[start:stop]
+        assert end not in text[start:stop]
+
+    def test_stops_at_first_end_of_body_heading(self) -> None:
+        text = _paper("1 Introduction", "Acknowledgments") + "References\n[2] B.\n"
+        start, stop = _find_heading_range(text, MIN_LENGTH)
+        assert text[stop:].startswith("Acknowledgments")
+
+    def test_missing_introduction_returns_none(self) -> None:
+        assert _find_heading_range(_paper(None, "References"), MIN_LENGTH) is None
+
+    def test_missing_references_returns_none(self) -> None:
+        assert _find_heading_range(_paper("Introduction", None), MIN_LENGTH) is None
+
+    def test_references_before_introduction_returns_none(self) -> None:
+        text = _paper("Introduction", None, preamble="References\n")
+        assert _find_heading_range(text, MIN_LENGTH) is None
+
+    def test_end_heading_closer_than_min_length_is_ignored(self) -> None:
+        text = "Introduction\nShort.\nReferences\n[1] A.\n"
+        assert _find_heading_range(text, MIN_LENGTH) is None
+
+    def test_inline_mentions_are_not_headings(self) -> None:
+        text = (
+            "As shown in the introduction, ...\n" + BODY + "See the references below.\n"
+        )
+        assert _find_heading_range(text, MIN_LENGTH) is None
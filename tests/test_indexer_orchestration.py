@@ -70,3 +70,43 @@ class TestRunExtractAndBuildOrdering:
         _, builder, _ = self._run([_paper("2606.001"), _paper("")])
         # falsy arxiv_id is dropped before cleanup.
         builder.clean_existing_documents.assert_called_once_with(["2606.001"])
+
+
+@pytest.mark.unit
+class TestSetupStores:
+    """The batched SSM lookup must map each endpoint to the right store."""
+
+    def test_endpoints_map_to_stores_regardless_of_response_order(self) -> None:
+        from paper_bridge.indexer.configs import Config
+
+        ssm = MagicMock()
+        ssm.get_parameters.side_effect = lambda Names, WithDecryption: {
+            "Parameters": [
+                {"Name": n, "Value": f"{n.rsplit('/', 1)[-1]}.example.com"}
+                for n in reversed(Names)
+            ],
+            "InvalidParameters": [],
+        }
+        session = MagicMock()
+        session.client.return_value = ssm
+
+        with (
+            patch.object(indexer, "GraphStoreFactory") as graph_factory,
+            patch.object(indexer, "VectorStoreFactory") as vector_factory,
+            patch.object(indexer, "NeptuneClient") as neptune_client,
+            patch.object(indexer, "OpenSearchClient") as opensearch_client,
+        ):
+            opensearch_client.for_indexes.return_value = {}
+            indexer._setup_stores(Config(), session)
+
+        graph_factory.for_graph_store.assert_called_once_with(
+            "neptune-db://neptune-endpoint.example.com"
+        )
+        vector_factory.for_vector_store.assert_called_once_with(
+            "aoss://opensearch-endpoint.example.com"
+        )
+        neptune_client.assert_called_once_with("neptune-endpoint.example.com")
+        assert (
+            opensearch_client.for_indexes.call_args.args[0]
+            == "opensearch-endpoint.example.com"
+        )
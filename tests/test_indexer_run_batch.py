@@ -0,0 +1,56 @@
+"""Tests for ``paper_bridge.indexer.run_batch``.
+
+``get_batch_job_names`` decides which Batch queue and job definition the indexer
+job is submitted to, so the SSM name -> value mapping must not depend on the
+order GetParameters returns parameters in.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from paper_bridge.indexer.configs import Config
+from paper_bridge.indexer.run_batch import get_batch_job_names
+
+
+def _session_with_reversed_ssm(*missing: str) -> tuple[MagicMock, MagicMock]:
+    """Session whose GetParameters answers in reverse order and reports ``missing``
+    names as invalid."""
+    ssm = MagicMock()
+    ssm.get_parameters.side_effect = lambda Names, WithDecryption: {
+        "Parameters": [
+            {"Name": n, "Value": n.rsplit("/", 1)[-1].upper()}
+            for n in reversed(Names)
+            if n not in missing
+        ],
+        "InvalidParameters": [n for n in Names if n in missing],
+    }
+    session = MagicMock()
+    session.client.return_value = ssm
+    return session, ssm
+
+
+@pytest.mark.unit
+class TestGetBatchJobNames:
+    def test_maps_names_regardless_of_response_order(self) -> None:
+        config = Config()
+        session, ssm = _session_with_reversed_ssm()
+        queue, definition = get_batch_job_names(session, config)
+        assert queue == "BATCH-JOB-QUEUE-INDEXER"
+        assert definition == "BATCH-JOB-DEFINITION-INDEXER"
+
+        base = f"/{config.resources.project_name}-{config.resources.stage}"
+        ssm.get_parameters.assert_called_once_with(
+            Names=[
+                f"{base}/batch-job-queue-indexer",
+                f"{base}/batch-job-definition-indexer",
+            ],
+            WithDecryption=True,
+        )
+
+    def test_missing_parameter_raises(self) -> None:
+        config = Config()
+        base = f"/{config.resources.project_name}-{config.resources.stage}"
+        session, _ = _session_with_reversed_ssm(f"{base}/batch-job-queue-indexer")
+        with pytest.raises(ValueError, match="batch-job-queue-indexer"):
+            get_batch_job_names(session, config)
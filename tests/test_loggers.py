@@ -23,8 +23,16 @@ class TestSharedLogger:
         from paper_bridge.shared.logger import is_aws_env
 
         monkeypatch.setenv("AWS_LAMBDA_FUNCTION_NAME", "fn")
+        is_aws_env.cache_clear()
         assert is_aws_env() is True
 
+    def test_is_aws_env_is_cached(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from paper_bridge.shared.logger import is_aws_env
+
+        assert is_aws_env() is False
+        monkeypatch.setenv("AWS_LAMBDA_FUNCTION_NAME", "fn")
+        assert is_aws_env() is False
+
     def test_get_log_level_default_info(self, monkeypatch: pytest.MonkeyPatch) -> None:
         from paper_bridge.shared.logger import get_log_level
 
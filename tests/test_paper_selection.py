@@ -66,6 +66,16 @@ class TestSelectBasics:
         out = PaperScorer().select(papers, limit=3, reference_date=REF)
         assert len(out) == 3
 
+    def test_truncated_top_matches_full_ranking(self) -> None:
+        # Includes score ties (same votes and age) broken by title.
+        papers = [
+            _p(str(i), upvotes=i % 4, days_old=i % 3, title=f"T{9 - i}")
+            for i in range(10)
+        ]
+        scorer = PaperScorer()
+        ranked = [s.paper for s in scorer.score_all(papers, REF)]
+        assert scorer.select(papers, limit=4, reference_date=REF) == ranked[:4]
+
     def test_returns_input_objects(self) -> None:
         p = _p("a", 10)
         out = PaperScorer().select([p], limit=1, reference_date=REF)
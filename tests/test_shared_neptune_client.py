@@ -61,10 +61,21 @@ class TestPaperIdValidation:
 
 
 # Stage queries are distinguished by structural markers rather than brittle
-# full-string matches: per-source stages end in ".id().fold()"; the shared
-# facts/entities stages use ".project('id', 'owners')". A helper routes a fake
-# response per stage so tests can exercise the real collect/owner-subset/drop
-# logic.
+# full-string matches: the per-source stages share one ".project('chunks', ...)"
+# query; the shared facts/entities stages use ".project('id', 'owners')" and end
+# in ".fold()". A helper routes a fake response per stage so tests can exercise
+# the real collect/owner-subset/drop logic.
+def _is_per_source(q: str) -> bool:
+    return "project('chunks', 'statements', 'topics')" in q
+
+
+def _per_source(chunks=(), statements=(), topics=()):
+    """Fake result of the per-source collect query."""
+    return [
+        {"chunks": list(chunks), "statements": list(statements), "topics": list(topics)}
+    ]
+
+
 def _is_collect(q: str) -> bool:
     return q.strip().endswith(".fold()")
 
@@ -82,6 +93,15 @@ def _is_fact_project(q: str) -> bool:
     return _is_owner_project(q) and "__SUBJECT__" not in q
 
 
+def _stage_responses(q: str) -> list:
+    """One statement owning one fact, so every collect stage is submitted."""
+    if _is_per_source(q):
+        return _per_source(["c1"], ["s1"], ["t1"])
+    if _is_fact_project(q):
+        return [[{"id": "f1", "owners": ["s1"]}]]
+    return [[]] if _is_collect(q) else []
+
+
 @pytest.mark.unit
 class TestBestEffortDelete:
     def test_one_failing_stage_does_not_abort_others(self) -> None:
@@ -92,7 +112,7 @@ class TestBestEffortDelete:
                 raise Exception("MemoryLimitExceededException")
             if _is_owner_project(q):
                 return [[]]
-            return [["v1"]] if _is_collect(q) else []
+            return _per_source(["v1"], ["v1"], ["v1"]) if _is_per_source(q) else []
 
         nc = _client_with_submit(side_effect)
         result = nc.delete_document("2606.03458")
@@ -111,12 +131,15 @@ class TestBestEffortDelete:
         def submit(query, bindings=None):
             q = query.strip()
             res: object = []
-            if _is_owner_project(q):
+            if _is_fact_project(q):
+                order.append("collect")
+                res = [[{"id": "f1", "owners": ["v1"]}]]
+            elif _is_owner_project(q):
                 order.append("collect")
                 res = [[]]
-            elif _is_collect(q):
+            elif _is_per_source(q):
                 order.append("collect")
-                res = [["v1"]]
+                res = _per_source(["v1"], ["v1"], ["v1"])
             elif q.startswith("g.V('v1'") and q.endswith(".drop()"):
                 order.append("drop")
             return SimpleNamespace(all=lambda: SimpleNamespace(result=lambda: res))
@@ -126,17 +149,17 @@ class TestBestEffortDelete:
         nc._gremlin_client.submit.side_effect = submit
         nc.delete_document("2606.03458")
 
-        # 5 collects (chunks/statements/topics + facts/entities projects) precede
+        # 3 collects (the per-source project + facts/entities projects) precede
         # the first drop.
         first_drop = order.index("drop")
-        assert order[:first_drop].count("collect") == 5
+        assert order[:first_drop].count("collect") == 3
         assert "drop" not in order[:first_drop]
 
     def test_all_stages_succeed_is_success(self) -> None:
         def side_effect(q):
             if _is_owner_project(q):
                 return [[]]
-            return [["v1"]] if _is_collect(q) else []
+            return _per_source(["v1"], ["v1"], ["v1"]) if _is_per_source(q) else []
 
         nc = _client_with_submit(side_effect)
         result = nc.delete_document("2606.03458")
@@ -148,8 +171,8 @@ class TestBestEffortDelete:
         # one wholly owned is deleted. Statements collected = {s1, s2}.
         def side_effect(q):
             # Order matters: the fact/entity project queries are built on top of
-            # the statements traversal (so they also contain hasLabel(Statement)
-            # and end in .fold()); match the project queries FIRST.
+            # the statements traversal (so they also contain hasLabel(Statement));
+            # match the owner-project queries FIRST.
             if _is_fact_project(q):
                 return [
                     [
@@ -159,9 +182,10 @@ class TestBestEffortDelete:
                 ]
             if _is_entity_project(q):
                 return [[{"id": "e_owned", "owners": ["f_owned"]}]]
-            if "hasLabel('__Statement__')" in q and _is_collect(q):
-                return [["s1", "s2"]]  # this paper's statements
-            return [["c1"]] if _is_collect(q) else []
+            if _is_per_source(q):
+                # this paper's statements are s1, s2
+                return _per_source(["c1"], ["s1", "s2"], ["c1"])
+            return []
 
         nc = _client_with_submit(side_effect)
         result = nc.delete_document("2606.03458")
@@ -179,7 +203,7 @@ class TestBestEffortDelete:
         def side_effect(q):
             if _is_owner_project(q):
                 return [[]]
-            return [many] if _is_collect(q) else []
+            return _per_source(many) if _is_per_source(q) else []
 
         nc = _client_with_submit(side_effect)
         nc.delete_document("2606.03458")
@@ -203,7 +227,7 @@ class TestBestEffortDelete:
 
         def side_effect(q):
             captured.append(q)
-            return [[]] if q.strip().endswith(".fold()") else []
+            return _stage_responses(q)
 
         nc = _client_with_submit(side_effect)
         nc.delete_document("2606.03458")
@@ -217,18 +241,74 @@ class TestBestEffortDelete:
         assert "union(out('__SUBJECT__'), out('__OBJECT__'))" not in entity_q
         assert "in('__SUBJECT__', '__OBJECT__').id().fold()" not in entity_q
 
+    def test_per_source_stages_collected_in_one_submit(self) -> None:
+        nc = _client_with_submit(
+            lambda q: _per_source(["c1"], ["s1"], ["t1"]) if _is_per_source(q) else []
+        )
+        result = nc.delete_document("2606.03458")
+
+        per_source = [q for q in nc._submitted if _is_per_source(q)]
+        assert len(per_source) == 1
+        # fold() first so duplicate source vertices merge into one map.
+        assert per_source[0].startswith(
+            "g.V().has('__Source__', 'paper_id', '2606.03458').fold()"
+        )
+        assert result["deleted_nodes"]["chunks"] == 1
+        assert result["deleted_nodes"]["statements"] == 1
+        assert result["deleted_nodes"]["topics"] == 1
+
+    def test_empty_upstream_skips_owner_queries(self) -> None:
+        # No statements -> no fact can be owned -> neither owner query is sent.
+        nc = _client_with_submit(
+            lambda q: _per_source(["c1"]) if _is_per_source(q) else []
+        )
+        result = nc.delete_document("2606.03458")
+
+        assert result["status"] == "success"
+        assert result["deleted_nodes"]["facts"] == 0
+        assert result["deleted_nodes"]["entities"] == 0
+        assert not any(_is_owner_project(q) for q in nc._submitted)
+
+    def test_no_owned_facts_skips_entity_query(self) -> None:
+        def side_effect(q):
+            if _is_per_source(q):
+                return _per_source(["c1"], ["s1"])
+            if _is_fact_project(q):
+                return [[{"id": "f_shared", "owners": ["s1", "sX"]}]]
+            return []
+
+        nc = _client_with_submit(side_effect)
+        nc.delete_document("2606.03458")
+
+        assert any(_is_fact_project(q) for q in nc._submitted)
+        assert not any(_is_entity_project(q) for q in nc._submitted)
+
+    def test_per_source_failure_marks_all_three_stages(self) -> None:
+        def side_effect(q):
+            if _is_per_source(q):
+                raise Exception("boom")
+            return [[]] if _is_collect(q) else []
+
+        nc = _client_with_submit(side_effect)
+        result = nc.delete_document("2606.03458")
+        assert result["status"] == "error"
+        assert set(result["failed_stages"]) >= {"chunks", "statements", "topics"}
+        assert result["deleted_nodes"]["source"] == 1
+
     def test_per_hop_dedup_present_in_collect_queries(self) -> None:
         # Guards the MemoryLimitExceeded fix: every .in() hop must be deduped.
         captured = []
 
         def side_effect(q):
             captured.append(q)
-            return [[]] if q.strip().endswith(".fold()") else []
+            return _stage_responses(q)
 
         nc = _client_with_submit(side_effect)
         nc.delete_document("2606.03458")
 
-        fold_qs = [q for q in captured if q.strip().endswith(".fold()")]
+        fold_qs = [q for q in captured if ".fold()" in q]
+        assert any(_is_per_source(q) for q in fold_qs)
+        assert any(_is_entity_project(q) for q in fold_qs)
         for q in fold_qs:
             # No ".in('X')" should be immediately followed by another ".in("
             # without a ".dedup()" between them.
@@ -301,6 +381,43 @@ class TestMemoryLimitRetry:
             nc._submit_query("g.V().count()", sleep=lambda s: None)
 
 
+@pytest.mark.unit
+class TestGremlinClient:
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    def test_pool_sized_to_max_workers(
+        self, max_workers: int, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from paper_bridge.shared import neptune_client
+
+        gremlin_client = MagicMock()
+        monkeypatch.setattr(neptune_client.client, "Client", gremlin_client)
+        monkeypatch.setattr(NeptuneClient, "MAX_WORKERS", max_workers)
+
+        nc = NeptuneClient("neptune.example.com")
+        assert nc.client is nc.client  # built once, lazily
+        gremlin_client.assert_called_once()
+        kwargs = gremlin_client.call_args.kwargs
+        assert kwargs["pool_size"] == max_workers
+        assert kwargs["max_workers"] == max_workers
+
+
+@pytest.mark.unit
+class TestBatchDelete:
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    def test_preserves_order_and_isolates_errors(
+        self, max_workers: int, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(NeptuneClient, "MAX_WORKERS", max_workers)
+        nc = _client_with_submit(lambda q: [[]] if _is_collect(q) else [])
+        results = nc.batch_delete_documents(["a", "bad id", "c"])
+        assert [r["paper_id"] for r in results] == ["a", "bad id", "c"]
+        assert [r["status"] for r in results] == ["success", "error", "success"]
+
+    def test_sequential_by_default(self) -> None:
+        # Concurrent deletes would orphan facts shared within the batch.
+        assert NeptuneClient.MAX_WORKERS == 1
+
+
 @pytest.mark.unit
 class TestSummarize:
     def test_counts_success_and_error(self) -> None:
@@ -45,6 +45,8 @@ class TestDeleteDocument:
         assert body["query"]["term"]["metadata.source.metadata.paper_id"] == (
             "2606.03458"
         )
+        # Version conflicts must not abort the delete part-way.
+        assert oc.client.delete_by_query.call_args.kwargs["conflicts"] == "proceed"
 
     def test_empty_paper_id_raises(self) -> None:
         oc = _client()
@@ -99,3 +101,35 @@ class TestDateDeletes:
         results = oc.batch_delete_documents(["a", "b"])
         assert len(results) == 2
         assert oc.client.delete_by_query.call_count == 2
+
+    def test_batch_delete_preserves_order_and_isolates_errors(self) -> None:
+        oc = _client()
+        results = oc.batch_delete_documents(["a", "", "c"])
+        assert [r["paper_id"] for r in results] == ["a", "", "c"]
+        assert [r["status"] for r in results] == ["success", "error", "success"]
+        assert oc.client.delete_by_query.call_count == 2
+
+
+@pytest.mark.unit
+class TestForIndexes:
+    def test_indexes_share_one_connection(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from paper_bridge.shared import opensearch_client
+
+        opensearch = MagicMock()
+        monkeypatch.setattr(opensearch_client, "OpenSearch", opensearch)
+        monkeypatch.setattr(opensearch_client, "AWS4Auth", MagicMock())
+        session = MagicMock()
+
+        clients = OpenSearchClient.for_indexes(
+            "aoss.example.com", 443, ["chunk", "statement"], session, "us-west-2"
+        )
+
+        assert list(clients) == ["chunk", "statement"]
+        assert clients["chunk"].index == "chunk"
+        assert clients["chunk"].client is clients["statement"].client
+        opensearch.assert_called_once()
+        session.get_credentials.assert_called_once()
+        pool = opensearch.call_args.kwargs["pool_maxsize"]
+        assert pool == OpenSearchClient.MAX_WORKERS
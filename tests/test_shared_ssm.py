@@ -0,0 +1,124 @@
+"""Tests for ``paper_bridge.shared.ssm``.
+
+The session is a ``MagicMock`` whose ``.client(...)`` returns a controlled stub,
+so no real AWS is touched.
+"""
+
+import random
+from unittest.mock import MagicMock
+
+import pytest
+from botocore.exceptions import ClientError
+
+from paper_bridge.shared.ssm import get_ssm_param_value, get_ssm_param_values
+
+
+def _session_with_ssm(ssm: MagicMock) -> MagicMock:
+    session = MagicMock()
+    session.client.return_value = ssm
+    return session
+
+
+def _shuffled_get_parameters(Names: list[str], WithDecryption: bool) -> dict:
+    # GetParameters does not promise to return parameters in request order.
+    parameters = [{"Name": n, "Value": f"value-of-{n}"} for n in Names]
+    random.Random(len(Names)).shuffle(parameters)
+    return {"Parameters": parameters, "InvalidParameters": []}
+
+
+@pytest.mark.unit
+class TestGetSsmParamValue:
+    def test_returns_value(self) -> None:
+        ssm = MagicMock()
+        ssm.get_parameter.return_value = {"Parameter": {"Value": "https://x"}}
+        assert get_ssm_param_value(_session_with_ssm(ssm), "/p") == "https://x"
+        ssm.get_parameter.assert_called_once_with(Name="/p", WithDecryption=True)
+
+    def test_repeat_lookup_is_served_from_cache(self) -> None:
+        ssm = MagicMock()
+        ssm.get_parameter.return_value = {"Parameter": {"Value": "v"}}
+        session = _session_with_ssm(ssm)
+        assert get_ssm_param_value(session, "/p") == "v"
+        assert get_ssm_param_value(session, "/p") == "v"
+        assert ssm.get_parameter.call_count == 1
+
+    def test_client_error_raises_and_is_not_cached(self) -> None:
+        ssm = MagicMock()
+        ssm.get_parameter.side_effect = ClientError(
+            {"Error": {"Code": "ParameterNotFound", "Message": "nope"}},
+            "GetParameter",
+        )
+        session = _session_with_ssm(ssm)
+        with pytest.raises(ClientError):
+            get_ssm_param_value(session, "/missing")
+        with pytest.raises(ClientError):
+            get_ssm_param_value(session, "/missing")
+        assert ssm.get_parameter.call_count == 2
+
+
+@pytest.mark.unit
+class TestGetSsmParamValues:
+    def test_fetches_all_names_in_one_call(self) -> None:
+        ssm = MagicMock()
+        ssm.get_parameters.side_effect = _shuffled_get_parameters
+        result = get_ssm_param_values(_session_with_ssm(ssm), ["/a", "/b"])
+        assert result == {"/a": "value-of-/a", "/b": "value-of-/b"}
+        ssm.get_parameters.assert_called_once_with(
+            Names=["/a", "/b"], WithDecryption=True
+        )
+
+    def test_only_uncached_names_are_requested(self) -> None:
+        ssm = MagicMock()
+        ssm.get_parameter.return_value = {"Parameter": {"Value": "1"}}
+        ssm.get_parameters.side_effect = _shuffled_get_parameters
+        session = _session_with_ssm(ssm)
+        get_ssm_param_value(session, "/a")
+        result = get_ssm_param_values(session, ["/a", "/b"])
+        assert result == {"/a": "1", "/b": "value-of-/b"}
+        ssm.get_parameters.assert_called_once_with(Names=["/b"], WithDecryption=True)
+
+    def test_fully_cached_makes_no_call(self) -> None:
+        ssm = MagicMock()
+        ssm.get_parameters.side_effect = _shuffled_get_parameters
+        session = _session_with_ssm(ssm)
+        get_ssm_param_values(session, ["/a"])
+        get_ssm_param_values(session, ["/a"])
+        assert ssm.get_parameters.call_count == 1
+
+    def test_more_than_ten_names_are_chunked(self) -> None:
+        names = [f"/p{i}" for i in range(23)]
+        ssm = MagicMock()
+        ssm.get_parameters.side_effect = _shuffled_get_parameters
+        result = get_ssm_param_values(_session_with_ssm(ssm), names)
+        assert result == {n: f"value-of-{n}" for n in names}
+        assert [c.kwargs["Names"] for c in ssm.get_parameters.call_args_list] == [
+            names[:10],
+            names[10:20],
+            names[20:],
+        ]
+
+    def test_result_follows_requested_order(self) -> None:
+        names = ["/z", "/a", "/m", "/b"]
+        ssm = MagicMock()
+        ssm.get_parameters.side_effect = _shuffled_get_parameters
+        result = get_ssm_param_values(_session_with_ssm(ssm), names)
+        assert list(result) == names
+        assert list(result.values()) == [f"value-of-{n}" for n in names]
+
+    def test_duplicate_names_requested_once(self) -> None:
+        ssm = MagicMock()
+        ssm.get_parameters.side_effect = _shuffled_get_parameters
+        result = get_ssm_param_values(_session_with_ssm(ssm), ["/a", "/b", "/a"])
+        assert result == {"/a": "value-of-/a", "/b": "value-of-/b"}
+        ssm.get_parameters.assert_called_once_with(
+            Names=["/a", "/b"], WithDecryption=True
+        )
+
+    def test_invalid_parameters_raise_value_error(self) -> None:
+        ssm = MagicMock()
+        ssm.get_parameters.return_value = {
+            "Parameters": [{"Name": "/a", "Value": "1"}],
+            "InvalidParameters": ["/missing"],
+        }
+        with pytest.raises(ValueError, match="/missing"):
+            get_ssm_param_values(_session_with_ssm(ssm), ["/a", "/missing"])
@@ -5,6 +5,7 @@ session whose ``.client(...)`` returns a controlled stub. No real AWS, no moto:
 the clients are pure mocks, keeping the tests dependency-free and deterministic.
 """
 
+from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
@@ -13,6 +14,8 @@ from botocore.exceptions import ClientError
 from paper_bridge.summarizer.src.aws_helpers import (
     get_cross_inference_model_id,
     get_ssm_param_value,
+    upload_dir_to_s3,
+    upload_to_s3,
 )
 
 
@@ -70,6 +73,36 @@ class TestGetCrossInferenceModelId:
         )
         assert result == "anthropic.claude-sonnet-4-6"
 
+    def test_profile_list_fetched_once_per_session_and_region(self) -> None:
+        bedrock = MagicMock()
+        bedrock.list_inference_profiles.return_value = {
+            "inferenceProfileSummaries": [
+                {"inferenceProfileId": "us.anthropic.claude-sonnet-4-6"}
+            ]
+        }
+        session = _session_with_client(bedrock)
+        for model_id in ("anthropic.claude-sonnet-4-6", "anthropic.claude-opus-4-6"):
+            get_cross_inference_model_id(session, model_id, "us-west-2")
+        bedrock.list_inference_profiles.assert_called_once()
+
+    def test_failed_profile_list_is_retried(self) -> None:
+        bedrock = MagicMock()
+        bedrock.list_inference_profiles.side_effect = [
+            RuntimeError("throttled"),
+            {
+                "inferenceProfileSummaries": [
+                    {"inferenceProfileId": "us.anthropic.claude-sonnet-4-6"}
+                ]
+            },
+        ]
+        session = _session_with_client(bedrock)
+        model_id = "anthropic.claude-sonnet-4-6"
+        assert get_cross_inference_model_id(session, model_id, "us-west-2") == model_id
+        assert (
+            get_cross_inference_model_id(session, model_id, "us-west-2")
+            == "us.anthropic.claude-sonnet-4-6"
+        )
+
     @pytest.mark.parametrize(
         "session,model_id,region",
         [
@@ -106,3 +139,32 @@ class TestGetSsmParamValue:
     def test_empty_name_raises(self) -> None:
         with pytest.raises(ValueError):
             get_ssm_param_value(_session_with_client(MagicMock()), "")
+
+
+@pytest.mark.unit
+class TestUploadToS3:
+    def test_s3_client_reused_across_uploads(self, tmp_path: Path) -> None:
+        s3 = MagicMock()
+        session = _session_with_client(s3)
+        for name in ("a.html", "a.png"):
+            path = tmp_path / name
+            path.write_text("x")
+            assert upload_to_s3(session, path, "bucket", "outputs") is True
+        session.client.assert_called_once()
+        assert s3.upload_file.call_count == 2
+
+
+@pytest.mark.unit
+class TestUploadDirToS3:
+    def test_small_files_are_not_split_into_multipart_uploads(
+        self, tmp_path: Path
+    ) -> None:
+        (tmp_path / "paper.pdf").write_bytes(b"%PDF")
+        s3 = MagicMock()
+        count = upload_dir_to_s3(
+            _session_with_client(s3), str(tmp_path), "bucket", "inputs"
+        )
+        assert count == 1
+        config = s3.upload_file.call_args.kwargs["Config"]
+        assert config.multipart_threshold == 25 * 1024 * 1024
+        assert config.multipart_chunksize == 25 * 1024 * 1024
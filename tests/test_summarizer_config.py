@@ -92,7 +92,7 @@ class TestFromYaml:
             Config.from_yaml(tmp_path / "does_not_exist.yaml")
 
     def test_none_fields_fall_back_to_defaults(self, tmp_path: Path) -> None:
-        # BaseModelWithDefaults should replace explicit None with the field default.
+        # from_yaml drops explicit None so the field default applies.
         yaml_text = textwrap.dedent(
             """
             resources:
@@ -1,4 +1,4 @@
-"""Tests for shared text utilities (markdown→Slack links, unique URL extraction).
+"""Tests for shared text utilities (markdown→Slack links, unique URLs, dates).
 
 These were previously duplicated across output handlers; the shared module is
 the single source of truth, so its behavior is locked here.
@@ -9,6 +9,7 @@ import pytest
 from paper_bridge.shared.text_utils import (
     convert_markdown_to_slack_links,
     extract_unique_urls,
+    is_iso_date,
 )
 
 
@@ -57,3 +58,16 @@ class TestExtractUniqueUrls:
     def test_mixed_plain_and_markdown(self) -> None:
         result = extract_unique_urls("http://x, [Y](http://y)")
         assert result == ["http://x", "[Y](http://y)"]
+
+
+@pytest.mark.unit
+class TestIsIsoDate:
+    @pytest.mark.parametrize("ok", ["2026-06-05", "1999-12-31"])
+    def test_valid(self, ok: str) -> None:
+        assert is_iso_date(ok)
+
+    @pytest.mark.parametrize(
+        "bad", ["", "2026-6-5", "06-05-2026", "2026-06-05T00:00", "2026-06-05\n"]
+    )
+    def test_invalid(self, bad: str) -> None:
+        assert not is_iso_date(bad)